@@ -121,6 +121,46 @@ prepare_appdir() {
     info "AppDir structure prepared"
 }
 
+# Bundle third-party web assets so the app does not depend on CDNs at runtime
+# Keep this list in sync with VENDORED_ASSETS in src/config.py
+vendor_web_assets() {
+    info "Bundling web assets..."
+
+    local VENDOR_CACHE="$BUILD_DIR/vendor"
+    local VENDOR_DIR="$APPDIR/src/static/vendor"
+    local assets=(
+        "daisyui.css|https://cdn.jsdelivr.net/npm/daisyui@5"
+        "daisyui-themes.css|https://cdn.jsdelivr.net/npm/daisyui@5/themes.css"
+        "daisyui-properties.css|https://cdn.jsdelivr.net/npm/daisyui@5/colors/properties.css"
+        "daisyui-properties-extended.css|https://cdn.jsdelivr.net/npm/daisyui@5/colors/properties-extended.css"
+        "tailwindcss-browser.js|https://cdn.jsdelivr.net/npm/@tailwindcss/browser@4"
+        "htmx.js|https://cdn.jsdelivr.net/npm/htmx.org@2.0.7/dist/htmx.js"
+        "htmx-ext-sse.js|https://unpkg.com/htmx-ext-sse"
+        "fasthtml.js|https://cdn.jsdelivr.net/gh/answerdotai/fasthtml-js@1.0.12/fasthtml.js"
+        "surreal.js|https://cdn.jsdelivr.net/gh/answerdotai/surreal@main/surreal.js"
+        "css-scope-inline.js|https://cdn.jsdelivr.net/gh/gnat/css-scope-inline@main/script.js"
+    )
+
+    mkdir -p "$VENDOR_CACHE" "$VENDOR_DIR"
+
+    local asset name url
+    for asset in "${assets[@]}"; do
+        name="${asset%%|*}"
+        url="${asset#*|}"
+        if [ -s "$VENDOR_CACHE/$name" ]; then
+            warn "$name already exists, skipping download"
+        else
+            wget -q -O "$VENDOR_CACHE/$name" "$url" || {
+                rm -f "$VENDOR_CACHE/$name"
+                error "Failed to download $url"
+            }
+        fi
+        cp "$VENDOR_CACHE/$name" "$VENDOR_DIR/$name"
+    done
+
+    info "Web assets bundled"
+}
+
 # Setup micromamba environment in AppDir
 setup_micromamba_env() {
     info "Setting up micromamba environment in AppDir..."
@@ -271,6 +311,7 @@ main() {
     download_micromamba
     download_appimage_tools
     prepare_appdir
+    vendor_web_assets
     setup_micromamba_env
     create_desktop_entry
     build_appimage
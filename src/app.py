@@ -5,22 +5,15 @@ System Information and Resource Monitoring Dashboard with real-time updates via
 
 from fasthtml.common import *
 from fasthtml.common import sse_message
-import os
-import sys
-import subprocess
-import platform
-import socket
-import webbrowser
-from contextlib import closing
 from datetime import datetime
-import tempfile
 from pathlib import Path
 import asyncio
 import json
-import threading
+import re
 import time
-import psutil
-from concurrent.futures import TimeoutError
+import zlib
+from starlette.datastructures import MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware
 
 # SSE imports
 from cjm_fasthtml_sse.core import SSEBroadcastManager
@@ -61,29 +54,33 @@ from cjm_fasthtml_tailwind.utilities.effects import shadow
 from cjm_fasthtml_tailwind.utilities.layout import position, right, top, display_tw
 from cjm_fasthtml_tailwind.core.base import combine_classes
 
-from cjm_fasthtml_sysmon.core.utils import open_browser
+from utils import format_uptime, open_browser
 from cjm_fasthtml_sysmon.core.html_ids import HtmlIds
 import config
-from cjm_fasthtml_sysmon.monitors.cpu import get_cpu_info
-from cjm_fasthtml_sysmon.monitors.system import get_static_system_info
-from cjm_fasthtml_sysmon.monitors.memory import get_memory_info
-from cjm_fasthtml_sysmon.monitors.disk import get_disk_info
-from cjm_fasthtml_sysmon.monitors.network import get_network_info
-from cjm_fasthtml_sysmon.monitors.processes import get_process_info
-from cjm_fasthtml_sysmon.monitors.gpu import get_gpu_info
-from cjm_fasthtml_sysmon.monitors.sensors import get_temperature_info
-from cjm_fasthtml_sysmon.components.base import render_process_count, render_process_status
-from cjm_fasthtml_sysmon.components.cards import (
-    render_os_info_card,
+from monitors import (
+    get_static_system_info,
+    get_cpu_info,
+    get_memory_info,
+    get_disk_info,
+    get_network_info,
+    get_process_info,
+    get_gpu_info,
+    get_temperature_info
+)
+from cjm_fasthtml_sysmon.components.cards import render_os_info_card, render_process_card
+from components import (
     render_cpu_card,
+    render_cpu_sections,
     render_memory_card,
     render_disk_card,
     render_network_card,
-    render_process_card,
     render_gpu_card,
-    render_temperature_card
+    render_temperature_card,
+    render_process_count,
+    render_process_status,
+    render_cpu_processes_table,
+    render_memory_processes_table
 )
-from cjm_fasthtml_sysmon.components.tables import render_cpu_processes_table, render_memory_processes_table
 from cjm_fasthtml_sysmon.components.modals import render_settings_modal
 
 from uvicorn.main import Server
@@ -93,6 +90,32 @@ original_handler = Server.handle_exit
 # Initialize SSE Broadcast Manager first (moved up)
 sse_manager = SSEBroadcastManager(**config.SSE_CONFIG)
 
+def request_full_resend():
+    """Make the coming ticks resend every component, not only the changed ones."""
+    config.LAST_BROADCAST_DATA.clear()
+    config.LAST_BROADCAST_HTML.clear()
+
+class DropOldestQueue(asyncio.Queue):
+    """Per-client message queue that discards its oldest message when full.
+
+    Updates only carry the cards that changed, so a dropped one may have been
+    the only copy of a card's new state; a drop therefore marks this client as
+    needing full state, which it is sent on its next read. The broadcast never
+    waits on a slow client, and other clients keep getting only changes.
+    """
+    dropped = 0
+    needs_full_state = False
+
+    def put_nowait(self, item):
+        if self.full():
+            self.get_nowait()
+            self.dropped += 1
+            self.needs_full_state = True
+        super().put_nowait(item)
+
+    async def put(self, item):
+        self.put_nowait(item)
+
 class SSEShutdownHandler:
     should_exit = False
     active_connections = set()
@@ -104,6 +127,7 @@ class SSEShutdownHandler:
 
         # Signal shutdown to all waiting tasks
         SSEShutdownHandler.shutdown_event.set()
+        update_wakeup.set()
 
         # Send shutdown message directly to all SSE connection queues
         try:
@@ -165,45 +189,171 @@ app.hdrs.append(Link(rel='icon', type='image/png', href='/static/layout-dashboar
 # Insert HTMX SSE extension
 insert_htmx_sse_ext(app.hdrs)
 
+def use_vendored_assets(hdrs):
+    """Point CDN headers at the copies bundled under /static/vendor when present"""
+    for hdr in hdrs:
+        if isinstance(hdr, (list, tuple)):
+            use_vendored_assets(hdr)
+            continue
+        for attr in ('src', 'href'):
+            fname = config.VENDORED_ASSETS.get(hdr.attrs.get(attr))
+            if fname and (config.VENDOR_DIR / fname).exists():
+                hdr.attrs[attr] = f'/static/vendor/{fname}'
+
+use_vendored_assets(app.hdrs)
+
+class StaticCacheMiddleware:
+    """Add Cache-Control headers to successful responses for /static assets"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get('path', '')
+        if scope['type'] != 'http' or not path.startswith('/static/'):
+            await self.app(scope, receive, send)
+            return
+
+        cache_control = (config.VENDOR_CACHE_CONTROL if path.startswith('/static/vendor/')
+                         else config.STATIC_CACHE_CONTROL)
+
+        async def send_with_cache_control(message):
+            if message['type'] == 'http.response.start' and message['status'] == 200:
+                MutableHeaders(scope=message)['Cache-Control'] = cache_control
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_control)
+
+app.add_middleware(StaticCacheMiddleware)
+
+# Compress HTML and static assets; the markup is dominated by repeated class
+# strings. Starlette leaves text/event-stream responses uncompressed.
+app.add_middleware(GZipMiddleware, minimum_size=config.GZIP_MINIMUM_SIZE)
+
+# Precomputed class strings
+# combine_classes() is a pure join over constant utility tokens, so build each
+# bundle once at import time instead of on every request/tick.
+STATUS_DOT_CLS = {
+    color: combine_classes(status, getattr(status_colors, color), status_sizes.sm, m.r(1), m.r(2).sm)
+    for color in ('success', 'warning', 'error', 'info')
+}
+STATUS_TEXT_CLS = {
+    color: combine_classes(
+        getattr(text_dui, color),
+        font_size.sm,
+        display_tw.hidden,          # Hide text on mobile
+        display_tw.inline.sm        # Show on small screens and up
+    )
+    for color in ('success', 'warning', 'error', 'info')
+}
+NAVBAR_START_CLS = str(navbar_start)
+PAGE_TITLE_CLS = combine_classes(
+    font_size.lg,          # Smaller on mobile
+    font_size.xl.sm,       # Medium on small screens
+    font_size._2xl.md,     # Large on medium+ screens
+    font_weight.bold,
+    text_dui.base_content
+)
+CONNECTION_STATUS_CLS = combine_classes(flex_display, items.center)
+SETTINGS_TEXT_CLS = combine_classes(
+    display_tw.hidden,          # Hide text on mobile
+    display_tw.inline.sm        # Show on small screens and up
+)
+SETTINGS_BTN_CLS = combine_classes(btn, btn_sizes.sm, btn_styles.ghost)
+NAVBAR_END_CLS = combine_classes(
+    flex_display,
+    justify.end,
+    items.center,
+    gap(2),               # Smaller gap on mobile
+    gap(4).sm,            # Normal gap on small+
+    navbar_end
+)
+NAVBAR_CLS = combine_classes(
+    navbar,
+    bg_dui.base_100,
+    shadow.sm,
+    p(2),                     # Smaller padding on mobile
+    p(4).sm                   # Normal padding on small+
+)
+OVERVIEW_TITLE_CLS = combine_classes(
+    font_size.lg,              # Smaller on mobile
+    font_size.xl.sm,           # Medium on small
+    font_size._2xl.md,         # Large on medium+
+    font_weight.semibold,
+    text_dui.base_content,
+    m.b(4),                    # Less margin on mobile
+    m.b(6).sm                  # Normal margin on small+
+)
+OVERVIEW_TEXT_CLS = combine_classes(
+    text_dui.base_content,
+    font_size.xs,            # Extra small on mobile
+    font_size.sm.sm,         # Small on small screens+
+    break_all              # Allow line breaks for long hostnames
+)
+OVERVIEW_CLS = combine_classes(
+    m.b(4),                    # Less margin on mobile
+    m.b(6).sm                  # Normal margin on small+
+)
+CARD_CLS = combine_classes(card, bg_dui.base_100, shadow.md)
+CARD_GRID_CLS = combine_classes(
+    grid_display,
+    grid_cols(1),          # Mobile: 1 column (default)
+    grid_cols(1).sm,       # Small: still 1 column (for better readability)
+    grid_cols(2).md,       # Medium: 2 columns
+    grid_cols(2).lg,       # Large: 2 columns (cards have good width)
+    grid_cols(3).xl,       # Extra large: 3 columns
+    grid_cols(4)._2xl,     # 2XL: 4 columns for ultra-wide screens
+    gap(4),                # Reduced gap for mobile
+    gap(6).md              # Larger gap for bigger screens
+)
+FOOTER_CLS = str(m.t(8))
+FOOTER_TEXT_CLS = combine_classes(text_dui.base_content, font_size.xs, text_align.center)
+CONTAINER_CLS = combine_classes(
+    p(4),                    # Smaller padding on mobile
+    p(6).sm,                 # Normal padding on small+
+    p(8).lg,                 # Larger padding on desktop
+    max_w.screen_2xl,
+    m.auto
+)
+PAGE_CLS = combine_classes(min_h.screen, bg_dui.base_200)
+TIMESTAMP_TEXT_CLS = combine_classes(text_dui.base_content, font_size.sm)
+
+# Set to wake the update loop before its delay is up: on shutdown, or when a
+# page becomes visible after the loop had slowed down for hidden pages
+update_wakeup = asyncio.Event()
+
+def mark_page_visible():
+    """Record that a dashboard page is visible, waking the update loop if it had slowed down."""
+    now = time.monotonic()
+    if now - config.LAST_VISIBLE_TIME['time'] > config.VISIBILITY_TIMEOUT:
+        update_wakeup.set()
+    config.LAST_VISIBLE_TIME['time'] = now
+
+@rt
+async def visible():
+    """Visibility ping sent by dashboard pages while they are shown."""
+    mark_page_visible()
+    return ""
+
 # Helper functions for connection status indicators
 def create_connection_status_indicators():
     """Create status indicator elements for different connection states"""
     return {
         'active': Span(
-            Span(cls=combine_classes(status, status_colors.success, status_sizes.sm, m.r(1), m.r(2).sm)),
-            Span("Live", cls=combine_classes(
-                text_dui.success,
-                font_size.sm,
-                display_tw.hidden,          # Hide text on mobile
-                display_tw.inline.sm        # Show on small screens and up
-            )),
+            Span(cls=STATUS_DOT_CLS['success']),
+            Span("Live", cls=STATUS_TEXT_CLS['success']),
         ),
         'disconnected': Span(
-            Span(cls=combine_classes(status, status_colors.warning, status_sizes.sm, m.r(1), m.r(2).sm)),
-            Span("Disconnected", cls=combine_classes(
-                text_dui.warning,
-                font_size.sm,
-                display_tw.hidden,
-                display_tw.inline.sm
-            )),
+            Span(cls=STATUS_DOT_CLS['warning']),
+            Span("Disconnected", cls=STATUS_TEXT_CLS['warning']),
         ),
         'error': Span(
-            Span(cls=combine_classes(status, status_colors.error, status_sizes.sm, m.r(1), m.r(2).sm)),
-            Span("Error", cls=combine_classes(
-                text_dui.error,
-                font_size.sm,
-                display_tw.hidden,
-                display_tw.inline.sm
-            )),
+            Span(cls=STATUS_DOT_CLS['error']),
+            Span("Error", cls=STATUS_TEXT_CLS['error']),
         ),
         'reconnecting': Span(
-            Span(cls=combine_classes(status, status_colors.info, status_sizes.sm, m.r(1), m.r(2).sm)),
-            Span("Reconnecting...", cls=combine_classes(
-                text_dui.info,
-                font_size.sm,
-                display_tw.hidden,
-                display_tw.inline.sm
-            )),
+            Span(cls=STATUS_DOT_CLS['info']),
+            Span("Reconnecting...", cls=STATUS_TEXT_CLS['info']),
         )
     }
 
@@ -310,8 +460,18 @@ def render_sse_connection_monitor():
             }}
         }});
 
+        // Report that this page is shown so the server keeps its full update
+        // rate; with no visible page it slows down
+        function reportVisible() {{
+            if (!document.hidden && !isShuttingDown) {{
+                fetch('{visible.to()}', {{method: 'POST'}});
+            }}
+        }}
+        setInterval(reportVisible, {config.VISIBILITY_PING_INTERVAL * 1000});
+
         // Handle page visibility changes
         document.addEventListener('visibilitychange', function() {{
+            reportVisible();
             if (!document.hidden && sseElement && !isShuttingDown) {{
                 // Check connection state when page becomes visible
                 let evtSource = sseElement._sseEventSource;
@@ -330,11 +490,88 @@ def render_sse_connection_monitor():
 
     return Script(monitor_script)
 
+def render_navbar():
+    """Create the dashboard navbar"""
+    # Get initial connection status indicator
+    indicators = create_connection_status_indicators()
+
+    return Div(
+        Div(
+            Div(
+                H1("System Monitor Dashboard", cls=PAGE_TITLE_CLS),
+                cls=NAVBAR_START_CLS
+            ),
+            Div(
+                # Connection status indicator - dynamically updated
+                Label(
+                    indicators['reconnecting'],  # Start with reconnecting status
+                    id=HtmlIds.CONNECTION_STATUS,
+                    cls=CONNECTION_STATUS_CLS
+                ),
+                # Settings button - icon only on mobile
+                Button(
+                    Span("⚙", cls=""),
+                    Span(" Settings", cls=SETTINGS_TEXT_CLS),
+                    cls=SETTINGS_BTN_CLS,
+                    onclick="settings_modal.showModal()"
+                ),
+                create_theme_selector(),
+                cls=NAVBAR_END_CLS
+            ),
+            cls=NAVBAR_CLS
+        )
+    )
+
+# Static system info never changes after boot (and platform.processor() may
+# shell out to uname), so collect it once and read the cached copy afterwards
+config.STATIC_SYSTEM_INFO.update(get_static_system_info())
+
+# Static page fragments
+# Nothing in these depends on request or system state, so render them to HTML
+# once at import time; NotStr lets the page renderer copy the markup verbatim
+# instead of walking the FT trees on every page load.
+NAVBAR_HTML = NotStr(to_xml(render_navbar()))
+SSE_MONITOR_HTML = NotStr(to_xml(render_sse_connection_monitor()))
+
+# The OS card is static apart from the uptime description, so render it once
+# and split the markup around the uptime text; only that piece is rebuilt.
+OS_INFO_CARD_HEAD, OS_INFO_CARD_TAIL = re.split(
+    r'Uptime: [^<]*', to_xml(render_os_info_card()), maxsplit=1
+)
+
+# The SSE timestamp swap only varies by the time string, so pre-render the OOB
+# element around a placeholder and concatenate the current time on each tick.
+TIMESTAMP_SWAP_HEAD, TIMESTAMP_SWAP_TAIL = to_xml(oob_swap(
+    P(f"Monitoring {config.STATIC_SYSTEM_INFO['hostname']} • __TIMESTAMP__", cls=TIMESTAMP_TEXT_CLS),
+    target_id=HtmlIds.TIMESTAMP,
+    swap_type="innerHTML"
+)).split('__TIMESTAMP__')
+
+def render_timestamp_swap():
+    """Render the OOB timestamp update from the cached template"""
+    return NotStr(f"{TIMESTAMP_SWAP_HEAD}{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{TIMESTAMP_SWAP_TAIL}")
+
+def encode_swaps(swaps):
+    """Frame markup swaps as one SSE message, as sse_message() would, and encode it"""
+    data = '\n'.join(f'data: {line}' for swap in swaps for line in swap.splitlines())
+    return f'{data}\n\n'.encode()
+
+def render_full_state_payload():
+    """Encode the markup last broadcast for every swap target as one SSE message"""
+    return encode_swaps([*config.LAST_BROADCAST_HTML.values(), render_timestamp_swap()])
+
+def render_os_info_card_html():
+    """Render the OS information card from the cached template"""
+    uptime = format_uptime(config.STATIC_SYSTEM_INFO['boot_timestamp'])
+    return NotStr(f"{OS_INFO_CARD_HEAD}Uptime: {uptime}{OS_INFO_CARD_TAIL}")
+
 @rt
 def index():
     # Get initial system information
-    static_info = get_static_system_info()
-    cpu_info = get_cpu_info()
+    static_info = config.STATIC_SYSTEM_INFO
+    # Measure against the update loop's CPU baseline without moving it, so a
+    # page load doesn't leave the loop's next reading a near-empty window
+    cpu_info = get_cpu_info(update_baseline=False)
     mem_info = get_memory_info()
     disk_info = get_disk_info()
     net_info = get_network_info()
@@ -342,60 +579,12 @@ def index():
     gpu_info = get_gpu_info()
     temp_info = get_temperature_info()
 
-    # Get initial connection status indicator
-    indicators = create_connection_status_indicators()
+    # Read the clock once so the header and footer timestamps agree
+    now = datetime.now()
 
     return Div(
         # Navbar with improved styling and mobile responsiveness
-        Div(
-            Div(
-                Div(
-                    H1("System Monitor Dashboard",
-                       cls=combine_classes(
-                           font_size.lg,          # Smaller on mobile
-                           font_size.xl.sm,       # Medium on small screens
-                           font_size._2xl.md,     # Large on medium+ screens
-                           font_weight.bold,
-                           text_dui.base_content
-                       )),
-                    cls=str(navbar_start)
-                ),
-                Div(
-                    # Connection status indicator - dynamically updated
-                    Label(
-                        indicators['reconnecting'],  # Start with reconnecting status
-                        id=HtmlIds.CONNECTION_STATUS,
-                        cls=combine_classes(flex_display, items.center)
-                    ),
-                    # Settings button - icon only on mobile
-                    Button(
-                        Span("⚙", cls=""),
-                        Span(" Settings", cls=combine_classes(
-                            display_tw.hidden,          # Hide text on mobile
-                            display_tw.inline.sm        # Show on small screens and up
-                        )),
-                        cls=combine_classes(btn, btn_sizes.sm, btn_styles.ghost),
-                        onclick="settings_modal.showModal()"
-                    ),
-                    create_theme_selector(),
-                    cls=combine_classes(
-                        flex_display,
-                        justify.end,
-                        items.center,
-                        gap(2),               # Smaller gap on mobile
-                        gap(4).sm,            # Normal gap on small+
-                        navbar_end
-                    )
-                ),
-                cls=combine_classes(
-                    navbar,
-                    bg_dui.base_100,
-                    shadow.sm,
-                    p(2),                     # Smaller padding on mobile
-                    p(4).sm                   # Normal padding on small+
-                )
-            )
-        ),
+        NAVBAR_HTML,
 
         # SSE connection for real-time updates
         Div(
@@ -410,122 +599,90 @@ def index():
         Div(
             # System Overview Header
             Div(
-                H2("System Overview", cls=combine_classes(
-                    font_size.lg,              # Smaller on mobile
-                    font_size.xl.sm,           # Medium on small
-                    font_size._2xl.md,         # Large on medium+
-                    font_weight.semibold,
-                    text_dui.base_content,
-                    m.b(4),                    # Less margin on mobile
-                    m.b(6).sm                  # Normal margin on small+
-                )),
-                P(f"Monitoring {static_info['hostname']} • {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                  cls=combine_classes(
-                      text_dui.base_content,
-                      font_size.xs,            # Extra small on mobile
-                      font_size.sm.sm,         # Small on small screens+
-                      break_all              # Allow line breaks for long hostnames
-                  )),
+                H2("System Overview", cls=OVERVIEW_TITLE_CLS),
+                P(f"Monitoring {static_info['hostname']} • {now.strftime('%Y-%m-%d %H:%M:%S')}",
+                  cls=OVERVIEW_TEXT_CLS),
                 id=HtmlIds.TIMESTAMP,
-                cls=combine_classes(
-                    m.b(4),                    # Less margin on mobile
-                    m.b(6).sm                  # Normal margin on small+
-                )
+                cls=OVERVIEW_CLS
             ),
 
             # Grid layout for cards
             Div(
                 # OS Information Card
                 Div(
-                    render_os_info_card(),
-                    cls=combine_classes(card, bg_dui.base_100, shadow.md)
+                    render_os_info_card_html(),
+                    cls=CARD_CLS
                 ),
 
                 # CPU Usage Card
                 Div(
                     render_cpu_card(cpu_info),
-                    cls=combine_classes(card, bg_dui.base_100, shadow.md),
+                    cls=CARD_CLS,
                     id=HtmlIds.CPU_CARD
                 ),
 
                 # Memory Usage Card
                 Div(
                     render_memory_card(mem_info),
-                    cls=combine_classes(card, bg_dui.base_100, shadow.md),
+                    cls=CARD_CLS,
                     id=HtmlIds.MEMORY_CARD
                 ),
 
                 # Disk Usage Card
                 Div(
                     render_disk_card(disk_info),
-                    cls=combine_classes(card, bg_dui.base_100, shadow.md),
+                    cls=CARD_CLS,
                     id=HtmlIds.DISK_CARD
                 ),
 
                 # Network Monitoring Card
                 Div(
                     render_network_card(net_info),
-                    cls=combine_classes(card, bg_dui.base_100, shadow.md),
+                    cls=CARD_CLS,
                     id=HtmlIds.NETWORK_CARD
                 ),
 
                 # Process Monitoring Card
                 Div(
                     render_process_card(proc_info),
-                    cls=combine_classes(card, bg_dui.base_100, shadow.md),
+                    cls=CARD_CLS,
                     id=HtmlIds.PROCESS_CARD
                 ),
 
                 # GPU Information Card
                 Div(
                     render_gpu_card(gpu_info),
-                    cls=combine_classes(card, bg_dui.base_100, shadow.md),
+                    cls=CARD_CLS,
                     id=HtmlIds.GPU_CARD
                 ),
 
                 # Temperature Sensors Card
                 Div(
                     render_temperature_card(temp_info),
-                    cls=combine_classes(card, bg_dui.base_100, shadow.md),
+                    cls=CARD_CLS,
                     id=HtmlIds.TEMPERATURE_CARD
                 ),
 
-                cls=combine_classes(
-                    grid_display,
-                    grid_cols(1),          # Mobile: 1 column (default)
-                    grid_cols(1).sm,       # Small: still 1 column (for better readability)
-                    grid_cols(2).md,       # Medium: 2 columns
-                    grid_cols(2).lg,       # Large: 2 columns (cards have good width)
-                    grid_cols(3).xl,       # Extra large: 3 columns
-                    grid_cols(4)._2xl,     # 2XL: 4 columns for ultra-wide screens
-                    gap(4),                # Reduced gap for mobile
-                    gap(6).md              # Larger gap for bigger screens
-                )
+                cls=CARD_GRID_CLS
             ),
 
             # Footer
             Div(
-                P(f"Last updated: {datetime.now().strftime('%H:%M:%S')}",
-                  cls=combine_classes(text_dui.base_content, font_size.xs, text_align.center)),
-                cls=str(m.t(8))
+                P(f"Last updated: {now.strftime('%H:%M:%S')}",
+                  cls=FOOTER_TEXT_CLS),
+                cls=FOOTER_CLS
             ),
 
-            cls=combine_classes(
-                p(4),                    # Smaller padding on mobile
-                p(6).sm,                 # Normal padding on small+
-                p(8).lg,                 # Larger padding on desktop
-                max_w.screen_2xl,
-                m.auto
-            )
+            cls=CONTAINER_CLS
         ),
 
         # Settings Modal
         render_settings_modal(config.REFRESH_INTERVALS, post_rt=update_intervals.to()),
 
         # SSE Connection Monitor Script
-        render_sse_connection_monitor(),
+        SSE_MONITOR_HTML,
 
-        cls=combine_classes(min_h.screen, bg_dui.base_200)
+        cls=PAGE_CLS
     )
 
 @rt
@@ -545,57 +702,87 @@ async def update_intervals(cpu: int, memory: int, disk: int, network: int, proce
 
     return ""  # Empty response for HTMX
 
+# Collector for each dashboard component, keyed like REFRESH_INTERVALS
+COLLECTORS = {
+    'cpu': get_cpu_info,
+    'memory': get_memory_info,
+    'disk': get_disk_info,
+    'network': get_network_info,
+    'process': get_process_info,
+    'gpu': get_gpu_info,
+    'temperature': get_temperature_info
+}
+
+async def collect_due_components(current_time):
+    """Run the collectors whose refresh interval has passed, concurrently in worker threads.
+
+    The collectors block on /proc, sysfs and nvidia-smi, so running them off
+    the event loop keeps SSE delivery to connected clients responsive.
+    """
+    due = [name for name, last_update in config.LAST_UPDATE_TIMES.items()
+           if current_time - last_update >= config.REFRESH_INTERVALS[name]]
+    results = await asyncio.gather(*(asyncio.to_thread(COLLECTORS[name]) for name in due))
+    return dict(zip(due, results))
+
 # Background task for generating system updates
 async def generate_system_updates():
     """Background task that generates system updates and broadcasts them to all clients."""
+    # Consecutive ticks that collected data but found nothing to send
+    idle_ticks = 0
+
     while not SSEShutdownHandler.should_exit:
         try:
-            current_time = time.time()
+            # Monotonic, so a wall-clock change can't stall or burst the intervals
+            current_time = time.monotonic()
+            due = await collect_due_components(current_time)
+            for name in due:
+                config.LAST_UPDATE_TIMES[name] = current_time
+
+            # Only re-send components whose data changed since the last broadcast
+            collected = {name: info for name, info in due.items()
+                         if info != config.LAST_BROADCAST_DATA.get(name)}
+
             updates = []
 
-            # Check and update CPU if interval has passed
-            if current_time - config.LAST_UPDATE_TIMES['cpu'] >= config.REFRESH_INTERVALS['cpu']:
-                cpu_info = get_cpu_info()
-                updates.append(oob_swap(
-                    render_cpu_card(cpu_info),
-                    target_id=HtmlIds.CPU_CARD_BODY,
-                    swap_type="outerHTML"
-                ))
-                config.LAST_UPDATE_TIMES['cpu'] = current_time
+            # Update CPU if it was due and has changed; its sections are swapped
+            # separately so unchanged ones (often the frequency row) are skipped
+            if 'cpu' in collected:
+                cpu_info = collected['cpu']
+                updates.extend(
+                    oob_swap(section, target_id=section.attrs['id'], swap_type="outerHTML")
+                    for section in render_cpu_sections(cpu_info) if section is not None
+                )
 
-            # Check and update Memory if interval has passed
-            if current_time - config.LAST_UPDATE_TIMES['memory'] >= config.REFRESH_INTERVALS['memory']:
-                mem_info = get_memory_info()
+            # Update Memory if it was due and has changed
+            if 'memory' in collected:
+                mem_info = collected['memory']
                 updates.append(oob_swap(
                     render_memory_card(mem_info),
                     target_id=HtmlIds.MEMORY_CARD_BODY,
                     swap_type="outerHTML"
                 ))
-                config.LAST_UPDATE_TIMES['memory'] = current_time
 
-            # Check and update Disk if interval has passed
-            if current_time - config.LAST_UPDATE_TIMES['disk'] >= config.REFRESH_INTERVALS['disk']:
-                disk_info = get_disk_info()
+            # Update Disk if it was due and has changed
+            if 'disk' in collected:
+                disk_info = collected['disk']
                 updates.append(oob_swap(
                     render_disk_card(disk_info),
                     target_id=HtmlIds.DISK_CARD_BODY,
                     swap_type="outerHTML"
                 ))
-                config.LAST_UPDATE_TIMES['disk'] = current_time
 
-            # Check and update Network if interval has passed
-            if current_time - config.LAST_UPDATE_TIMES['network'] >= config.REFRESH_INTERVALS['network']:
-                net_info = get_network_info()
+            # Update Network if it was due and has changed
+            if 'network' in collected:
+                net_info = collected['network']
                 updates.append(oob_swap(
                     render_network_card(net_info),
                     target_id=HtmlIds.NETWORK_CARD_BODY,
                     swap_type="outerHTML"
                 ))
-                config.LAST_UPDATE_TIMES['network'] = current_time
 
-            # Check and update Process if interval has passed
-            if current_time - config.LAST_UPDATE_TIMES['process'] >= config.REFRESH_INTERVALS['process']:
-                proc_info = get_process_info()
+            # Update Process if it was due and has changed
+            if 'process' in collected:
+                proc_info = collected['process']
                 # Use fine-grained updates for process card
                 updates.extend([
                     oob_swap(
@@ -619,52 +806,76 @@ async def generate_system_updates():
                         swap_type="outerHTML"
                     )
                 ])
-                config.LAST_UPDATE_TIMES['process'] = current_time
 
-            # Check and update GPU if interval has passed and available
-            if current_time - config.LAST_UPDATE_TIMES['gpu'] >= config.REFRESH_INTERVALS['gpu']:
-                gpu_info = get_gpu_info()
+            # Update GPU if it was due, has changed and is available
+            if 'gpu' in collected:
+                gpu_info = collected['gpu']
                 if gpu_info['available']:
                     updates.append(oob_swap(
                         render_gpu_card(gpu_info),
                         target_id=HtmlIds.GPU_CARD_BODY,
                         swap_type="outerHTML"
                     ))
-                config.LAST_UPDATE_TIMES['gpu'] = current_time
 
-            # Check and update Temperature if interval has passed
-            if current_time - config.LAST_UPDATE_TIMES['temperature'] >= config.REFRESH_INTERVALS['temperature']:
-                temp_info = get_temperature_info()
+            # Update Temperature if it was due and has changed
+            if 'temperature' in collected:
+                temp_info = collected['temperature']
                 updates.append(oob_swap(
                     render_temperature_card(temp_info),
                     target_id=HtmlIds.TEMPERATURE_CARD_BODY,
                     swap_type="outerHTML"
                 ))
-                config.LAST_UPDATE_TIMES['temperature'] = current_time
+
+            # Drop swaps whose markup is what clients already show; data can
+            # change below display precision without changing the card
+            changed = {}
+            for update in updates:
+                html = to_xml(update)
+                target = update.attrs['hx-swap-oob']
+                if config.LAST_BROADCAST_HTML.get(target) != html:
+                    changed[target] = html
+            updates = [NotStr(html) for html in changed.values()]
 
             # Always update timestamp
             if updates:  # Only add timestamp if there are other updates
-                updates.append(oob_swap(
-                    P(f"Monitoring {get_static_system_info()['hostname']} • {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                      cls=combine_classes(text_dui.base_content, font_size.sm)),
-                    target_id=HtmlIds.TIMESTAMP,
-                    swap_type="innerHTML"
-                ))
+                updates.append(render_timestamp_swap())
 
             # Broadcast updates to all connected clients if there are any
             if updates:
-                await sse_manager.broadcast("system_update", {"updates": updates})
-
-            # Wait before next check - use minimum interval for responsiveness
+                # Encode once here; every client streams the same bytes. The swaps
+                # are already markup, so frame them as sse_message() would
+                # instead of wrapping them in a Div for it to render again
+                payload = encode_swaps(updates)
+                await sse_manager.broadcast("system_update", {"payload": payload})
+
+            # Only now count the data and markup as sent; if rendering or the
+            # broadcast fails, the next tick sees them as changed and tries again
+            config.LAST_BROADCAST_DATA.update(collected)
+            config.LAST_BROADCAST_HTML.update(changed)
+
+            # Wait before next check - use minimum interval for responsiveness,
+            # doubling it while the system is idle and resetting on any change
+            if due:
+                idle_ticks = 0 if updates else min(idle_ticks + 1, 8)
             min_interval = min(config.REFRESH_INTERVALS.values())
-            await asyncio.sleep(min(1, min_interval))  # At least 1 second
+            delay = min(min(1, min_interval) * 2 ** idle_ticks, config.MAX_IDLE_INTERVAL)
+            if current_time - config.LAST_VISIBLE_TIME['time'] > config.VISIBILITY_TIMEOUT:
+                delay = max(delay, config.HIDDEN_INTERVAL)
+            # Count the time spent collecting and rendering against the delay,
+            # so checks keep to the clock instead of drifting later every tick
+            delay = max(0, delay - (time.monotonic() - current_time))
+            try:
+                # Wake on shutdown or a page becoming visible instead of sleeping out the delay
+                await asyncio.wait_for(update_wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            update_wakeup.clear()
 
         except Exception as e:
             print(f"Error generating updates: {e}")
             await asyncio.sleep(1)  # Wait before retrying
 
-# Start the background task when the module loads
-import asyncio
+# The single background update task, started by the first SSE connection
 update_task = None
 
 def start_update_task():
@@ -673,19 +884,48 @@ def start_update_task():
     if update_task is None or update_task.done():
         update_task = asyncio.create_task(generate_system_updates())
 
+# Keep proxies (e.g. nginx) from caching or buffering the event stream
+SSE_RESPONSE_HEADERS = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+
+async def gzip_event_stream(stream):
+    """Gzip an SSE stream, sync-flushing after each chunk so no event is held back.
+
+    GZipMiddleware skips text/event-stream because it buffers; a single
+    compressor per connection also lets repeated class strings in later
+    updates compress against earlier ones.
+    """
+    compressor = zlib.compressobj(wbits=31)  # 31 = gzip container
+    try:
+        async for chunk in stream:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+    finally:
+        await stream.aclose()
+
 @rt
-async def stream_updates():
+async def stream_updates(req):
     """SSE endpoint for streaming system updates to connected clients."""
     async def update_stream():
         # Create a task for this connection stream
         current_task = asyncio.current_task()
 
         # Register this connection with SSEBroadcastManager
-        queue = await sse_manager.register_connection()
+        queue = await sse_manager.register_connection(
+            DropOldestQueue(maxsize=config.SSE_CONFIG['max_queue_size'])
+        )
 
         # Track this connection in SSEShutdownHandler
         SSEShutdownHandler.active_connections.add(current_task)
 
+        # A page that just connected is being looked at
+        mark_page_visible()
+
+        # Resend every component on the next tick; this page may have missed
+        # updates that were skipped as unchanged for everyone else
+        request_full_resend()
+
         try:
             # Send initial connection confirmation
             yield f": Connected to system updates (active connections: {sse_manager.connection_count})\n\n"
@@ -714,12 +954,36 @@ async def stream_updates():
                         yield f"event: close\ndata: {json.dumps({'message': 'Server shutting down'})}\n\n"
                         break
 
-                    # Extract updates from the message
+                    # A client this far behind is better served by reconnecting.
+                    # No close event here: the page treats that as shutdown and
+                    # would stay disconnected; ending the stream lets it reconnect
+                    if queue.dropped >= config.SSE_MAX_DROPPED_MESSAGES:
+                        print(f"Closing slow SSE connection after {queue.dropped} dropped updates")
+                        break
+                    # Caught up, so only drops in a row count towards closing
+                    if queue.empty():
+                        queue.dropped = 0
+
+                    # After a drop this client may be missing card state. Skip the
+                    # older queued updates and send the markup last broadcast for
+                    # every card, then the newest update, which that markup may
+                    # not include yet
+                    if queue.needs_full_state and message.get("type") == "system_update":
+                        queue.needs_full_state = False
+                        while not queue.empty():
+                            newer = queue.get_nowait()
+                            if newer.get("type") != "system_update":
+                                queue.put_nowait(newer)
+                                break
+                            message = newer
+                        queue.dropped = 0
+                        yield render_full_state_payload()
+
+                    # Forward the pre-rendered SSE message
                     if message.get("type") == "system_update":
-                        updates = message.get("data", {}).get("updates", [])
-                        if updates:
-                            # Send as SSE message
-                            yield sse_message(Div(*updates))
+                        payload = message.get("data", {}).get("payload")
+                        if payload:
+                            yield payload
 
                 except asyncio.TimeoutError:
                     # Send heartbeat to keep connection alive
@@ -746,7 +1010,13 @@ async def stream_updates():
             # Remove from active connections
             SSEShutdownHandler.active_connections.discard(current_task)
 
-    return EventStream(update_stream())
+    if 'gzip' in req.headers.get('accept-encoding', ''):
+        response = EventStream(gzip_event_stream(update_stream()))
+        response.headers.update({'Content-Encoding': 'gzip', 'Vary': 'Accept-Encoding'})
+    else:
+        response = EventStream(update_stream())
+    response.headers.update(SSE_RESPONSE_HEADERS)
+    return response
 
 if __name__ == '__main__':
     import uvicorn
@@ -0,0 +1,741 @@
+"""
+Card renderers for the System Monitor Dashboard.
+
+Drop-in replacements for the cjm_fasthtml_sysmon cards that are re-rendered on
+every SSE tick. They produce the same markup, but build their class strings
+once at import instead of calling combine_classes() on every render.
+"""
+
+import bisect
+import functools
+from html import escape
+
+from fasthtml.common import Div, H3, Label, NotStr, P, Progress, Span, Table, Tbody, Td, Th, Thead, Tr, to_xml
+
+# DaisyUI imports
+from cjm_fasthtml_daisyui.components.data_display.card import card_body, card_title
+from cjm_fasthtml_daisyui.components.data_display.badge import badge, badge_colors, badge_sizes
+from cjm_fasthtml_daisyui.components.data_display.stat import stat, stat_title, stat_value, stat_desc, stats
+from cjm_fasthtml_daisyui.components.data_display.table import table, table_modifiers, table_sizes
+from cjm_fasthtml_daisyui.components.feedback.alert import alert, alert_colors
+from cjm_fasthtml_daisyui.components.feedback.progress import progress, progress_colors
+from cjm_fasthtml_daisyui.components.layout.divider import divider
+from cjm_fasthtml_daisyui.utilities.semantic_colors import bg_dui, text_dui
+
+# Tailwind imports
+from cjm_fasthtml_tailwind.utilities.layout import overflow
+from cjm_fasthtml_tailwind.utilities.spacing import p, m
+from cjm_fasthtml_tailwind.utilities.flexbox_and_grid import flex_display, flex, gap, items, justify, grid_display, grid_cols, flex_direction
+from cjm_fasthtml_tailwind.utilities.sizing import w, h, min_w
+from cjm_fasthtml_tailwind.utilities.typography import font_size, font_weight, text_align
+from cjm_fasthtml_tailwind.utilities.borders import rounded
+from cjm_fasthtml_tailwind.core.base import combine_classes
+
+from cjm_fasthtml_sysmon.core.html_ids import HtmlIds
+from utils import (
+    format_bandwidth,
+    format_bytes,
+    get_temperature_level,
+    PROGRESS_COLORS,
+    PROGRESS_THRESHOLDS,
+    TEMPERATURE_BADGE_COLORS,
+    TEMPERATURE_COLORS,
+)
+
+# Shared class strings
+CARD_BODY_CLS = combine_classes(card_body, p(6))
+CARD_TITLE_CLS = combine_classes(card_title, font_size.lg, font_weight.bold, text_dui.base_content)
+CARD_HEADER_CLS = combine_classes(flex_display, justify.between, items.center, m.b(6))
+SECTION_TITLE_CLS = combine_classes(font_size.sm, font_weight.semibold, m.b(3))
+MUTED_NOTE_CLS = combine_classes(font_size.xs, text_dui.base_content.opacity(70), m.t(2))
+MB6_CLS = str(m.b(6))
+MT6_CLS = str(m.t(6))
+ALERT_INFO_CLS = combine_classes(alert, alert_colors.info)
+
+# Header badge, indexed by whether usage is below 80%
+USAGE_BADGE_CLS = (
+    combine_classes(badge, badge_colors.error, badge_sizes.xl),
+    combine_classes(badge, badge_colors.primary, badge_sizes.xl),
+)
+
+# Stat card
+STAT_CLS = str(stat)
+STAT_TITLE_CLS = combine_classes(stat_title, font_size.xs, text_dui.base_content.opacity(60))
+STAT_VALUE_CLS = combine_classes(stat_value, font_size._2xl, font_weight.bold, text_dui.base_content)
+STAT_DESC_CLS = combine_classes(stat_desc, font_size.xs, text_dui.base_content.opacity(50))
+
+# Progress bar
+PROGRESS_LABEL_CLS = combine_classes(font_size.sm, font_weight.medium, text_dui.base_content)
+PROGRESS_VALUE_CLS = combine_classes(font_size.xs, text_dui.base_content.opacity(70))
+PROGRESS_HEADER_CLS = combine_classes(justify.between, m.b(2), "flex")
+
+# CPU card
+CPU_FREQ_CURRENT_CLS = combine_classes(text_dui.primary, font_size.sm, font_weight.medium)
+CPU_FREQ_LIMIT_CLS = combine_classes(text_dui.base_content.opacity(70), font_size.xs)
+CPU_FREQ_ROW_CLS = combine_classes(flex_display, justify.between, gap(2))
+CPU_CORE_LABEL_CLS = combine_classes(font_size.xs, text_dui.base_content.opacity(60), font_weight.normal)
+CPU_CORE_CLS = combine_classes(
+    flex_display, flex_direction.col, items.center, justify.center,
+    p(2), p(3).sm, bg_dui.base_200, rounded.md,
+    min_w(12), min_w(14).sm, h(12), h(14).sm
+)
+CPU_CORES_GRID_CLS = combine_classes(
+    grid_display,
+    grid_cols(4), grid_cols(6).sm, grid_cols(4).md, grid_cols(5).lg, grid_cols(5).xl, grid_cols(6)._2xl,
+    gap(2), gap(3).sm, w.full
+)
+
+# Disk and network entries
+ITEM_TITLE_CLS = combine_classes(font_size.sm, font_weight.semibold)
+ITEM_SUBTITLE_CLS = combine_classes(font_size.xs, text_dui.base_content.opacity(70))
+ITEM_HEADER_CLS = str(m.b(3))
+ITEM_PANEL_CLS = combine_classes(p(4), bg_dui.base_200, rounded.lg, m.b(4))
+
+# Network card; the bandwidth bars fill at 10 MB/s
+BANDWIDTH_BAR_SCALE = 10 / (1024 * 1024)
+BANDWIDTH_ROW_CLS = combine_classes(flex_display, justify.between)
+UPLOAD_RATE_CLS = combine_classes(font_size.xs, text_dui.info, font_weight.medium)
+DOWNLOAD_RATE_CLS = combine_classes(font_size.xs, text_dui.success, font_weight.medium)
+UPLOAD_BAR_CLS = combine_classes(progress, progress_colors.info, w.full, h(2))
+DOWNLOAD_BAR_CLS = combine_classes(progress, progress_colors.success, w.full, h(2))
+NETWORK_COUNT_BADGE_CLS = combine_classes(badge, badge_colors.info, badge_sizes.xl)
+NETWORK_STATS_CLS = combine_classes(stats, bg_dui.base_200, rounded.lg, p(2), font_size.xs, overflow.x.auto, w.full)
+MB3_CLS = str(m.b(3))
+MT2_CLS = str(m.t(2))
+MT3_CLS = str(m.t(3))
+MB4_CLS = str(m.b(4))
+
+# Process card, tables and badges
+PROCESS_COUNT_CLS = combine_classes(badge, badge_colors.primary, badge_sizes.lg)
+PROCESS_STATUS_CLS = combine_classes(flex_display, flex.wrap, gap(1), m.b(4))
+PROCESS_STATUS_BADGE_CLS = {
+    True: combine_classes(badge, badge_colors.info, badge_sizes.sm, m.r(2)),  # Running
+    False: combine_classes(badge, badge_colors.neutral, badge_sizes.sm, m.r(2)),
+}
+PROCESS_TABLE_CLS = combine_classes(table, table_modifiers.zebra, table_sizes.xs, w.full)
+TEXT_XS_CLS = str(font_size.xs)
+PROCESS_NAME_CLS = combine_classes(font_size.xs, font_weight.medium)
+# Usage badge, indexed by (percent > 25) + (percent > 50)
+PROCESS_USAGE_BADGE_CLS = tuple(
+    combine_classes(badge, color, badge_sizes.sm)
+    for color in (badge_colors.info, badge_colors.warning, badge_colors.error)
+)
+
+# GPU card
+SMALL_CARD_BODY_CLS = str(card_body)
+SMALL_CARD_TITLE_CLS = combine_classes(card_title, text_dui.base_content)
+SMALL_CARD_HEADER_CLS = combine_classes(flex_display, justify.between, items.center, m.b(4))
+GPU_TYPE_BADGE_CLS = combine_classes(badge, badge_colors.success, badge_sizes.lg)
+GPU_PANEL_CLS = combine_classes(p(3), bg_dui.base_200, rounded.lg, m.b(3))
+GPU_NAME_CLS = combine_classes(font_size.sm, font_weight.medium, m.b(2))
+METRIC_LABEL_CLS = combine_classes(font_size.xs, text_dui.base_content)
+METRIC_EXTRA_CLS = combine_classes(font_size.xs, text_dui.base_content, m.l(3))
+METRIC_ROW_CLS = combine_classes(flex_display, items.center)
+GPU_POWER_CLS = combine_classes(font_size.sm, text_dui.base_content)
+MT1_CLS = str(m.t(1))
+GPU_TEMPERATURE_NA_CLS = combine_classes(font_weight.medium, text_dui.base_content)
+GPU_TABLE_WRAPPER_CLS = combine_classes(overflow.x.auto, bg_dui.base_200, rounded.lg, p(2))
+GPU_TABLE_CLS = combine_classes(table, table_sizes.xs, w.full)
+GPU_PID_CLS = combine_classes(font_size.xs, text_dui.base_content)
+# GPU memory badge, indexed by (mb >= 4096) + (mb >= 8192)
+GPU_MEMORY_BADGE_CLS = tuple(
+    combine_classes(badge, color, badge_sizes.xs)
+    for color in (badge_colors.primary, badge_colors.warning, badge_colors.error)
+)
+# GPU utilization text, indexed by (percent >= 50) + (percent >= 80)
+GPU_USAGE_TEXT_CLS = tuple(
+    combine_classes(font_size.xs, color)
+    for color in (text_dui.success, text_dui.warning, text_dui.error)
+)
+
+# Temperature card, indexed by get_temperature_level()
+TEMPERATURE_VALUE_CLS = tuple(combine_classes(font_weight.medium, color) for color in TEMPERATURE_COLORS)
+TEMPERATURE_BADGE_CLS = tuple(combine_classes(badge, color, badge_sizes.lg) for color in TEMPERATURE_BADGE_COLORS)
+SENSOR_GROUP_TITLE_CLS = combine_classes(font_size.sm, font_weight.semibold, m.b(2), text_dui.base_content)
+SENSOR_ROW_CLS = combine_classes(flex_display, justify.between, items.center)
+SENSOR_PANEL_CLS = combine_classes(p(2), bg_dui.base_200, rounded.md, m.b(2))
+
+
+def static_html(component):
+    """Render a fragment that never changes once, for reuse in every update."""
+    return NotStr(to_xml(component))
+
+
+# Fragments that are identical in every render
+DISK_TITLE_HTML = static_html(Div(H3("Disk Usage", cls=CARD_TITLE_CLS), cls=MB6_CLS))
+NETWORK_TITLE_HTML = static_html(H3("Network", cls=CARD_TITLE_CLS))
+UPLOAD_LABEL_HTML = static_html(Span("↑ Upload", cls=METRIC_LABEL_CLS))
+DOWNLOAD_LABEL_HTML = static_html(Span("↓ Download", cls=METRIC_LABEL_CLS))
+CONNECTIONS_TITLE_HTML = static_html(P("Connections", cls=combine_classes(font_size.sm, font_weight.medium, m.b(2))))
+CPU_PROCESSES_THEAD_HTML = static_html(Thead(Tr(
+    Th("PID", cls=combine_classes(font_size.xs, w(16))),
+    Th("Name", cls=TEXT_XS_CLS),
+    Th("CPU %", cls=combine_classes(font_size.xs, w(20))),
+    Th("Memory", cls=combine_classes(font_size.xs, w(24))),
+    Th("User", cls=TEXT_XS_CLS)
+)))
+MEMORY_PROCESSES_THEAD_HTML = static_html(Thead(Tr(
+    Th("PID", cls=combine_classes(font_size.xs, w(16))),
+    Th("Name", cls=TEXT_XS_CLS),
+    Th("Memory %", cls=combine_classes(font_size.xs, w(20))),
+    Th("Memory", cls=combine_classes(font_size.xs, w(24))),
+    Th("User", cls=TEXT_XS_CLS)
+)))
+GPU_TITLE_HTML = static_html(H3("GPU Information", cls=SMALL_CARD_TITLE_CLS))
+GPU_DIVIDER_HTML = static_html(Div(cls=combine_classes(divider, m.y(3))))
+GPU_PROCESSES_TITLE_HTML = static_html(
+    P("GPU Processes", cls=combine_classes(font_size.sm, font_weight.semibold, m.b(3), text_dui.base_content))
+)
+GPU_PROCESSES_THEAD_HTML = static_html(Thead(Tr(*[
+    Th(heading, cls=combine_classes(font_size.xs, font_weight.medium, text_dui.base_content))
+    for heading in ("PID", "Process", "GPU Memory", "GPU Usage", "Device")
+])))
+NO_GPU_PROCESSES_HTML = static_html(Div(
+    P("No active GPU processes", cls=combine_classes(font_size.sm, text_dui.base_content, text_align.center, p(4))),
+    cls=combine_classes(bg_dui.base_200, rounded.lg),
+    id=HtmlIds.GPU_PROCESSES_TABLE_BODY
+))
+GPU_LABEL_HTML = {
+    name: static_html(P(name, cls=METRIC_LABEL_CLS))
+    for name in ("GPU Utilization", "Memory", "Temperature", "Power")
+}
+TEMPERATURE_TITLE_HTML = static_html(H3("Temperature Sensors", cls=SMALL_CARD_TITLE_CLS))
+
+
+def render_empty_card(title_html, message, card_id):
+    """Render a card body holding only its title and an info alert."""
+    return Div(
+        Div(title_html, cls=MB4_CLS),
+        Div(message, cls=ALERT_INFO_CLS),
+        cls=SMALL_CARD_BODY_CLS,
+        id=card_id
+    )
+
+
+# Progress bar for each of PROGRESS_COLORS, indexed by bisecting PROGRESS_THRESHOLDS
+PROGRESS_BAR_CLS = tuple(combine_classes(progress, color, w.full, h(2)) for color in PROGRESS_COLORS)
+
+
+def build_cpu_core_value_cls():
+    """Build the per-core percentage class string for each usage level."""
+    base = (font_size.xs, font_size.sm.sm, font_weight.semibold)
+    return (
+        combine_classes(*base, text_dui.base_content.opacity(60)),  # Idle
+        combine_classes(*base, text_dui.success),  # Low usage
+        combine_classes(*base, text_dui.warning),  # Medium usage
+        combine_classes(*base, text_dui.error),  # High usage
+    )
+
+
+CPU_CORE_VALUE_CLS = build_cpu_core_value_cls()
+
+
+def get_cpu_core_value_cls(percent):
+    """Get the per-core percentage class string for a CPU usage percentage."""
+    if percent < 20:
+        return CPU_CORE_VALUE_CLS[0]
+    elif percent < 50:
+        return CPU_CORE_VALUE_CLS[1]
+    elif percent < 80:
+        return CPU_CORE_VALUE_CLS[2]
+    else:
+        return CPU_CORE_VALUE_CLS[3]
+
+
+@functools.lru_cache(maxsize=None)
+def get_stat_value_cls(value_color):
+    """Get the stat value class string for a custom value color."""
+    return combine_classes(stat_value, font_size._2xl, font_weight.bold, value_color)
+
+
+def render_stat_card(title_text, value_text, desc_text=None, value_color=None):
+    """Render a stat card with consistent styling."""
+    value_cls = get_stat_value_cls(str(value_color)) if value_color else STAT_VALUE_CLS
+
+    return Div(
+        Div(title_text, cls=STAT_TITLE_CLS),
+        Div(value_text, cls=value_cls),
+        Div(desc_text, cls=STAT_DESC_CLS) if desc_text else None,
+        cls=STAT_CLS
+    )
+
+
+def render_progress_bar(value, max_value=100, label=None):
+    """Render a progress bar with label."""
+    return Div(
+        Div(
+            Span(label or f"{value:.1f}%", cls=PROGRESS_LABEL_CLS),
+            Span(f"{value:.1f}%", cls=PROGRESS_VALUE_CLS),
+            cls=PROGRESS_HEADER_CLS
+        ) if label else None,
+        Progress(
+            value=str(value),
+            max=str(max_value),
+            cls=PROGRESS_BAR_CLS[bisect.bisect_right(PROGRESS_THRESHOLDS, value)]
+        )
+    )
+
+
+def render_usage_header(title, percent, header_id=None):
+    """Render a card title with a usage badge."""
+    return Div(
+        H3(title, cls=CARD_TITLE_CLS),
+        Span(f"{percent:.1f}%", cls=USAGE_BADGE_CLS[percent < 80]),
+        cls=CARD_HEADER_CLS,
+        id=header_id
+    )
+
+
+# Per-core cell markup; cells only vary by index, percentage and color, and on
+# many-core hosts building an FT tree per cell dominated the CPU card render
+CPU_CORE_CELL_HTML = (
+    f'<div class="{CPU_CORE_CLS}"><span class="{CPU_CORE_LABEL_CLS}">C{{index}}</span>'
+    f'<div class="{{value_cls}}">{{percent:.0f}}%</div></div>'
+)
+
+
+def render_cpu_cores_grid(cpu_percents):
+    """Render CPU cores as a responsive grid with color-coded percentages."""
+    cells = ''.join(
+        CPU_CORE_CELL_HTML.format(index=i, percent=percent, value_cls=get_cpu_core_value_cls(percent))
+        for i, percent in enumerate(cpu_percents)
+    )
+    return NotStr(f'<div class="{CPU_CORES_GRID_CLS}">{cells}</div>')
+
+
+# CPU card sections, swapped separately so the unchanged ones can be skipped
+CPU_USAGE_HEADER_ID = 'cpu-usage-header'
+CPU_USAGE_BAR_ID = 'cpu-usage-bar'
+CPU_FREQUENCY_ID = 'cpu-frequency'
+CPU_CORES_ID = 'cpu-cores'
+
+
+def render_cpu_sections(cpu_info):
+    """Render the CPU card's sections, each with its own id."""
+    return (
+        render_usage_header("CPU Usage", cpu_info['percent'], header_id=CPU_USAGE_HEADER_ID),
+
+        # Overall CPU usage
+        Div(
+            render_progress_bar(cpu_info['percent'], label="Overall Usage"),
+            cls=MB6_CLS,
+            id=CPU_USAGE_BAR_ID
+        ),
+
+        # CPU Frequency
+        Div(
+            P("CPU Frequency", cls=SECTION_TITLE_CLS),
+            Div(
+                Span(f"Current: {cpu_info['frequency_current']:.0f} MHz", cls=CPU_FREQ_CURRENT_CLS),
+                Span(f"Min: {cpu_info['frequency_min']:.0f} MHz", cls=CPU_FREQ_LIMIT_CLS),
+                Span(f"Max: {cpu_info['frequency_max']:.0f} MHz", cls=CPU_FREQ_LIMIT_CLS),
+                cls=CPU_FREQ_ROW_CLS
+            ),
+            cls=MB6_CLS,
+            id=CPU_FREQUENCY_ID
+        ),
+
+        # Per-core usage
+        Div(
+            P("Per Core Usage", cls=SECTION_TITLE_CLS),
+            render_cpu_cores_grid(cpu_info['percent_per_core']),
+            cls=MT6_CLS,
+            id=CPU_CORES_ID
+        ) if cpu_info['percent_per_core'] else None,
+    )
+
+
+def render_cpu_card(cpu_info):
+    """Render the CPU usage card."""
+    return Div(
+        *render_cpu_sections(cpu_info),
+        cls=CARD_BODY_CLS,
+        id=HtmlIds.CPU_CARD_BODY
+    )
+
+
+def render_memory_card(mem_info):
+    """Render the memory usage card."""
+    return Div(
+        render_usage_header("Memory Usage", mem_info['percent']),
+
+        # RAM Usage
+        Div(
+            P("RAM", cls=SECTION_TITLE_CLS),
+            render_progress_bar(mem_info['percent'],
+                                label=f"{format_bytes(mem_info['used'])} / {format_bytes(mem_info['total'])}"),
+            P(f"Available: {format_bytes(mem_info['available'])}", cls=MUTED_NOTE_CLS),
+            cls=MB6_CLS
+        ),
+
+        # Swap Usage
+        Div(
+            P("Swap", cls=SECTION_TITLE_CLS),
+            render_progress_bar(mem_info['swap_percent'],
+                                label=f"{format_bytes(mem_info['swap_used'])} / {format_bytes(mem_info['swap_total'])}"),
+            cls=MT6_CLS
+        ) if mem_info['swap_total'] > 0 else None,
+
+        cls=CARD_BODY_CLS,
+        id=HtmlIds.MEMORY_CARD_BODY
+    )
+
+
+def render_disk_entries(disk_info):
+    """Render just the disk entries section."""
+    return Div(
+        (Div(
+            Div(
+                P(disk['device'], cls=ITEM_TITLE_CLS),
+                P(f"{disk['mountpoint']} ({disk['fstype']})", cls=ITEM_SUBTITLE_CLS),
+                cls=ITEM_HEADER_CLS
+            ),
+            render_progress_bar(disk['percent'],
+                                label=f"{format_bytes(disk['used'])} / {format_bytes(disk['total'])}"),
+            P(f"Free: {format_bytes(disk['free'])}", cls=MUTED_NOTE_CLS),
+            cls=ITEM_PANEL_CLS
+        ) for disk in disk_info[:5]),
+        cls="",
+        id=HtmlIds.DISK_ENTRIES
+    )
+
+
+def render_disk_card(disk_info):
+    """Render the disk usage card."""
+    return Div(
+        DISK_TITLE_HTML,
+        render_disk_entries(disk_info),
+        cls=CARD_BODY_CLS,
+        id=HtmlIds.DISK_CARD_BODY
+    )
+
+
+def render_network_interfaces(net_info):
+    """Render just the network interfaces section."""
+    return Div(
+        (Div(
+            # Interface header
+            Div(
+                P(interface['name'], cls=ITEM_TITLE_CLS),
+                P(', '.join(interface['ip_addresses']) if interface['ip_addresses'] else 'No IP',
+                  cls=ITEM_SUBTITLE_CLS),
+                cls=ITEM_HEADER_CLS
+            ),
+
+            # Bandwidth meters
+            Div(
+                Label(
+                    Label(
+                        UPLOAD_LABEL_HTML,
+                        Span(format_bandwidth(interface['bytes_sent_per_sec']), cls=UPLOAD_RATE_CLS),
+                        cls=BANDWIDTH_ROW_CLS
+                    ),
+                    Progress(
+                        value=str(min(100, interface['bytes_sent_per_sec'] * BANDWIDTH_BAR_SCALE)),
+                        max="100",
+                        cls=UPLOAD_BAR_CLS
+                    ),
+                    cls=MB3_CLS
+                ),
+                Label(
+                    Label(
+                        DOWNLOAD_LABEL_HTML,
+                        Span(format_bandwidth(interface['bytes_recv_per_sec']), cls=DOWNLOAD_RATE_CLS),
+                        cls=BANDWIDTH_ROW_CLS
+                    ),
+                    Progress(
+                        value=str(min(100, interface['bytes_recv_per_sec'] * BANDWIDTH_BAR_SCALE)),
+                        max="100",
+                        cls=DOWNLOAD_BAR_CLS
+                    ),
+                    cls=MB3_CLS
+                ),
+                Label(
+                    Span(f"Total: ↑{format_bytes(interface['bytes_sent'])} ↓{format_bytes(interface['bytes_recv'])}",
+                         cls=ITEM_SUBTITLE_CLS),
+                    cls=MT2_CLS
+                ),
+            ),
+
+            cls=ITEM_PANEL_CLS
+        ) for interface in net_info['interfaces'][:3]),
+        cls="",
+        id=HtmlIds.NETWORK_INTERFACES
+    )
+
+
+def render_network_connections(net_info):
+    """Render just the network connections section."""
+    connections = net_info['connections']
+
+    return Div(
+        CONNECTIONS_TITLE_HTML,
+        Div(
+            render_stat_card("Total", str(connections['total'])),
+            render_stat_card("Established", str(connections['established'])),
+            render_stat_card("Listening", str(connections['listen'])),
+            render_stat_card("Time Wait", str(connections['time_wait'])),
+            cls=NETWORK_STATS_CLS
+        ),
+        cls=MT3_CLS,
+        id=HtmlIds.NETWORK_CONNECTIONS
+    )
+
+
+def render_network_card(net_info):
+    """Render the network monitoring card."""
+    interfaces = net_info['interfaces']
+
+    if not interfaces:
+        return Div(
+            Div(NETWORK_TITLE_HTML, cls=MB6_CLS),
+            Div("No active network interfaces detected", cls=ALERT_INFO_CLS),
+            cls=CARD_BODY_CLS,
+            id=HtmlIds.NETWORK_CARD_BODY
+        )
+
+    return Div(
+        Div(
+            NETWORK_TITLE_HTML,
+            Span(f"{len(interfaces)} Active", cls=NETWORK_COUNT_BADGE_CLS),
+            cls=CARD_HEADER_CLS
+        ),
+        render_network_interfaces(net_info),
+        render_network_connections(net_info),
+        cls=CARD_BODY_CLS,
+        id=HtmlIds.NETWORK_CARD_BODY
+    )
+
+
+def render_process_count(total):
+    """Render the process count badge."""
+    return Span(f"{total} processes", cls=PROCESS_COUNT_CLS, id=HtmlIds.PROCESS_COUNT)
+
+
+def render_process_status(status_counts):
+    """Render the process status badges."""
+    return Div(
+        (Span(f"{status}: {count}", cls=PROCESS_STATUS_BADGE_CLS[status == 'running'])
+          for status, count in status_counts.items()),
+        cls=PROCESS_STATUS_CLS,
+        id=HtmlIds.PROCESS_STATUS
+    )
+
+
+# Process table row markup; both tables are re-sent on every process update,
+# so rows are formatted straight into HTML instead of built as FT trees
+PROCESS_ROW_HTML = (
+    f'<tr><td class="{TEXT_XS_CLS}">{{pid}}</td><td class="{PROCESS_NAME_CLS}">{{name}}</td>'
+    f'<td><label class="{{badge_cls}}">{{percent:.1f}}%</label></td>'
+    f'<td class="{TEXT_XS_CLS}">{{memory_mb:.0f}} MB</td><td class="{TEXT_XS_CLS}">{{username}}</td></tr>'
+)
+
+
+def render_processes_table(processes, thead_html, percent_key, table_id):
+    """Render a top-processes table ranked by one usage percentage."""
+    rows = ''.join(
+        PROCESS_ROW_HTML.format(
+            pid=proc['pid'],
+            name=escape(proc['name'] or '', quote=False),
+            badge_cls=PROCESS_USAGE_BADGE_CLS[(proc[percent_key] > 25) + (proc[percent_key] > 50)],
+            percent=proc[percent_key],
+            memory_mb=proc['memory_mb'],
+            username=escape(proc['username'], quote=False)
+        )
+        for proc in processes
+    )
+    return Div(
+        NotStr(f'<table class="{PROCESS_TABLE_CLS}">{thead_html}<tbody>{rows}</tbody></table>'),
+        id=table_id
+    )
+
+
+def render_cpu_processes_table(top_cpu):
+    """Render the CPU processes table."""
+    return render_processes_table(top_cpu, CPU_PROCESSES_THEAD_HTML, 'cpu_percent', HtmlIds.CPU_PROCESSES_TABLE)
+
+
+def render_memory_processes_table(top_memory):
+    """Render the memory processes table."""
+    return render_processes_table(top_memory, MEMORY_PROCESSES_THEAD_HTML, 'memory_percent', HtmlIds.MEMORY_PROCESSES_TABLE)
+
+
+def render_gpu_metrics(gpu_info):
+    """Render just the GPU metrics section (utilization, memory, temp, power)."""
+    if not gpu_info['available']:
+        return None
+
+    return Div(
+        (Div(
+            P(details['name'], cls=GPU_NAME_CLS),
+            Div(
+                Label(
+                    GPU_LABEL_HTML["GPU Utilization"],
+                    render_progress_bar(details['utilization']),
+                    cls=MB3_CLS
+                ),
+                Label(
+                    GPU_LABEL_HTML["Memory"],
+                    render_progress_bar(
+                        (details['memory_used'] / details['memory_total']) * 100 if details['memory_total'] > 0 else 0,
+                        label=f"{details['memory_used']} MB / {details['memory_total']} MB"
+                    ),
+                    cls=MB3_CLS
+                ),
+                Label(
+                    GPU_LABEL_HTML["Temperature"],
+                    Label(
+                        Span(
+                            f"{details['temperature']}°C" if details['temperature'] else "N/A",
+                            cls=(TEMPERATURE_VALUE_CLS[get_temperature_level(details['temperature'], 80)]
+                                 if details['temperature'] else GPU_TEMPERATURE_NA_CLS)
+                        ),
+                        cls=MT1_CLS
+                    ),
+                    cls=MB3_CLS
+                ) if details.get('temperature') is not None else None,
+                Label(
+                    GPU_LABEL_HTML["Power"],
+                    Label(
+                        Span(
+                            f"{details['power_usage']:.1f}W / {details['power_limit']:.1f}W" if details.get('power_limit')
+                            else f"{details['power_usage']:.1f}W",
+                            cls=GPU_POWER_CLS
+                        ),
+                        render_progress_bar(
+                            details['power_usage'] / details['power_limit'] * 100 if details['power_limit'] > 0 else 0
+                        ) if details.get('power_limit') else None,
+                        cls=""
+                    ),
+                    cls=MB3_CLS
+                ) if details.get('power_usage') is not None else None,
+                Label(
+                    Span(f"Fan: {details['fan_speed']}%", cls=METRIC_LABEL_CLS)
+                    if details.get('fan_speed') is not None else None,
+                    Span(f"Enc: {details['encoder_utilization']}%", cls=METRIC_EXTRA_CLS)
+                    if details.get('encoder_utilization') is not None else None,
+                    Span(f"Dec: {details['decoder_utilization']}%", cls=METRIC_EXTRA_CLS)
+                    if details.get('decoder_utilization') is not None else None,
+                    Span(f"Processes: {details['compute_processes']}", cls=METRIC_EXTRA_CLS)
+                    if details.get('compute_processes') is not None else None,
+                    cls=METRIC_ROW_CLS
+                ) if any([details.get('fan_speed'), details.get('encoder_utilization'),
+                          details.get('decoder_utilization'), details.get('compute_processes')]) else None,
+                cls=""
+            ),
+            cls=GPU_PANEL_CLS
+        ) for details in gpu_info['details'].values()),
+        cls="",
+        id=HtmlIds.GPU_METRICS
+    )
+
+
+def render_gpu_processes_table(gpu_processes):
+    """Render the GPU processes table from the collector's top GPU memory users."""
+    if not gpu_processes:
+        return NO_GPU_PROCESSES_HTML
+
+    return Div(
+        Table(
+            GPU_PROCESSES_THEAD_HTML,
+            Tbody(
+                (Tr(
+                    Td(str(proc['pid']), cls=GPU_PID_CLS),
+                    Td(proc['name'], cls=PROCESS_NAME_CLS),
+                    Td(Span(f"{proc['gpu_memory_mb']} MB",
+                            cls=GPU_MEMORY_BADGE_CLS[(proc['gpu_memory_mb'] >= 4096) + (proc['gpu_memory_mb'] >= 8192)]),
+                       cls=""),
+                    Td(f"{proc['gpu_utilization']}%",
+                       cls=GPU_USAGE_TEXT_CLS[(proc['gpu_utilization'] >= 50) + (proc['gpu_utilization'] >= 80)]),
+                    Td(f"GPU {proc['device_id']}", cls=GPU_PID_CLS),
+                ) for proc in gpu_processes),
+                cls="",
+                id=HtmlIds.GPU_PROCESSES_TABLE_BODY
+            ),
+            cls=GPU_TABLE_CLS
+        ),
+        cls=GPU_TABLE_WRAPPER_CLS,
+        id=HtmlIds.GPU_PROCESSES_TABLE
+    )
+
+
+def render_gpu_card(gpu_info):
+    """Render the GPU information card."""
+    if not gpu_info['available']:
+        return render_empty_card(GPU_TITLE_HTML, "No GPU detected or GPU monitoring not available",
+                                 HtmlIds.GPU_CARD_BODY)
+
+    return Div(
+        Div(
+            GPU_TITLE_HTML,
+            Span(gpu_info['type'], cls=GPU_TYPE_BADGE_CLS),
+            cls=SMALL_CARD_HEADER_CLS
+        ),
+        render_gpu_metrics(gpu_info),
+        Div(
+            GPU_DIVIDER_HTML,
+            GPU_PROCESSES_TITLE_HTML,
+            render_gpu_processes_table(gpu_info['processes']),
+            cls="",
+            id=HtmlIds.GPU_PROCESSES_SECTION
+        ) if gpu_info.get('processes') is not None else None,
+        cls=SMALL_CARD_BODY_CLS,
+        id=HtmlIds.GPU_CARD_BODY
+    )
+
+
+# Sensor row markup; servers can expose hundreds of sensors, so rows are
+# formatted straight into HTML instead of built as FT trees
+SENSOR_ROW_HTML = (
+    f'<div class="{SENSOR_PANEL_CLS}"><label class="{SENSOR_ROW_CLS}">'
+    f'<span class="{METRIC_LABEL_CLS}">{{label}}</span><label class="{METRIC_ROW_CLS}">'
+    f'<span class="{{value_cls}}">{{current:.1f}}°C</span></label></label></div>'
+)
+
+
+def render_temperature_sensors(temp_info):
+    """Render just the temperature sensors section, grouped by sensor type."""
+    grouped_temps = {}
+    for temp in temp_info:
+        grouped_temps.setdefault(temp['type'], []).append(temp)
+
+    return Div(
+        (Div(
+            P(temp_type.replace('_', ' ').title(), cls=SENSOR_GROUP_TITLE_CLS),
+            Div(
+                NotStr(''.join(
+                    SENSOR_ROW_HTML.format(
+                        label=escape(sensor['label'], quote=False),
+                        current=sensor['current'],
+                        value_cls=TEMPERATURE_VALUE_CLS[get_temperature_level(sensor['current'], sensor['high'] or 85)]
+                    )
+                    for sensor in sensors
+                )),
+                cls=""
+            ),
+            cls=MB3_CLS
+        ) for temp_type, sensors in grouped_temps.items()),
+        cls="",
+        id=HtmlIds.TEMPERATURE_SENSORS
+    )
+
+
+def render_temperature_card(temp_info):
+    """Render the temperature sensors card."""
+    if not temp_info:
+        return render_empty_card(TEMPERATURE_TITLE_HTML, "No temperature sensors detected",
+                                 HtmlIds.TEMPERATURE_CARD_BODY)
+
+    # Find the highest temperature for the header badge
+    max_temp = max(t['current'] for t in temp_info)
+
+    return Div(
+        Div(
+            TEMPERATURE_TITLE_HTML,
+            Span(f"{max_temp:.1f}°C", cls=TEMPERATURE_BADGE_CLS[get_temperature_level(max_temp)]),
+            cls=SMALL_CARD_HEADER_CLS
+        ),
+        render_temperature_sensors(temp_info),
+        cls=SMALL_CARD_BODY_CLS,
+        id=HtmlIds.TEMPERATURE_CARD_BODY
+    )
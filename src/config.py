@@ -3,7 +3,6 @@ Configuration and constants for the System Monitor Dashboard.
 """
 
 import os
-import tempfile
 from pathlib import Path
 from cjm_fasthtml_sysmon.core.utils import find_free_port
 
@@ -14,6 +13,7 @@ HOST = os.environ.get('FASTHTML_HOST', '127.0.0.1')
 
 # Setup writable directory for session keys and other files
 if os.environ.get('APPIMAGE'):
+    import tempfile
     WORK_DIR = Path(tempfile.mkdtemp(prefix='fasthtml-app-'))
     os.chdir(WORK_DIR)
 else:
@@ -26,6 +26,9 @@ else:
 # Maximum processes to show in top lists
 MAX_PROCESSES = 5
 
+# Maximum processes to show in the GPU processes table
+MAX_GPU_PROCESSES = 10
+
 # Refresh intervals configuration (in seconds)
 REFRESH_INTERVALS = {
     'cpu': 2,
@@ -37,6 +40,17 @@ REFRESH_INTERVALS = {
     'temperature': 5
 }
 
+# Longest wait between update checks; the loop backs off towards it while
+# collected data keeps coming back unchanged
+MAX_IDLE_INTERVAL = 5
+
+# Pages ping every VISIBILITY_PING_INTERVAL seconds while shown; once none has
+# for VISIBILITY_TIMEOUT seconds, updates slow to one check per HIDDEN_INTERVAL
+VISIBILITY_PING_INTERVAL = 10
+VISIBILITY_TIMEOUT = 30
+HIDDEN_INTERVAL = 10
+LAST_VISIBLE_TIME = {'time': float('-inf')}
+
 # Track last update times for each component
 LAST_UPDATE_TIMES = {
     'cpu': 0,
@@ -48,15 +62,78 @@ LAST_UPDATE_TIMES = {
     'temperature': 0
 }
 
+# Data last broadcast for each component; unchanged components are skipped
+LAST_BROADCAST_DATA = {}
+
+# Markup last broadcast for each OOB swap target; a swap that renders the same
+# as last time is skipped even if its underlying data changed
+LAST_BROADCAST_HTML = {}
+
 # Cache for system info that doesn't change
 STATIC_SYSTEM_INFO = {}
 
+# Whether psutil can report the current CPU frequency; cleared the first time
+# it returns None so the fallback isn't probed on every CPU update
+CPU_FREQ_CACHE = {'supported': True}
+
+# CPU (busy, total) ticks from the previous CPU update, overall then per core
+CPU_TIMES_CACHE = {'times': []}
+
 # Network monitoring state for bandwidth calculation
 NETWORK_STATS_CACHE = {}
 
+# Interface addresses and up/down state rarely change, so they are re-read at
+# most every NETWORK_ADDRS_TTL seconds instead of on every network update
+NETWORK_ADDRS_TTL = 30
+NETWORK_ADDRS_CACHE = {'time': float('-inf'), 'addrs': {}, 'down': frozenset()}
+
+# Mounted partitions rarely change, so the partition table is re-read at most
+# every DISK_PARTITIONS_TTL seconds; disk usage is still read on every update
+DISK_PARTITIONS_TTL = 60
+DISK_PARTITIONS_CACHE = {'time': float('-inf'), 'partitions': []}
+
+# Process monitoring state: all processes are scanned at most every
+# PROCESS_FULL_SCAN_INTERVAL seconds; in between exited processes are dropped,
+# new ones are read, and of the rest only the ones that were using CPU are
+# re-read while idle ones keep their last values
+PROCESS_FULL_SCAN_INTERVAL = 10
+PROCESS_CACHE = {'time': float('-inf'), 'procs': {}, 'entries': {}, 'active': set()}
+
+# Third-party web assets bundled into the AppImage by build.sh
+# When the file exists under static/vendor it is served locally instead of
+# being fetched from the CDN on every launch.
+VENDOR_DIR = Path(__file__).absolute().parent / 'static' / 'vendor'
+VENDORED_ASSETS = {
+    'https://cdn.jsdelivr.net/npm/daisyui@5': 'daisyui.css',
+    'https://cdn.jsdelivr.net/npm/daisyui@5/themes.css': 'daisyui-themes.css',
+    'https://cdn.jsdelivr.net/npm/daisyui@5/colors/properties.css': 'daisyui-properties.css',
+    'https://cdn.jsdelivr.net/npm/daisyui@5/colors/properties-extended.css': 'daisyui-properties-extended.css',
+    'https://cdn.jsdelivr.net/npm/@tailwindcss/browser@4': 'tailwindcss-browser.js',
+    'https://cdn.jsdelivr.net/npm/htmx.org@2.0.7/dist/htmx.js': 'htmx.js',
+    'https://unpkg.com/htmx-ext-sse': 'htmx-ext-sse.js',
+    'https://cdn.jsdelivr.net/gh/answerdotai/fasthtml-js@1.0.12/fasthtml.js': 'fasthtml.js',
+    'https://cdn.jsdelivr.net/gh/answerdotai/surreal@main/surreal.js': 'surreal.js',
+    'https://cdn.jsdelivr.net/gh/gnat/css-scope-inline@main/script.js': 'css-scope-inline.js',
+}
+
+# Cache-Control headers for files served under /static
+# Vendor file names don't carry a version and build.sh fetches floating ones
+# (e.g. daisyui@5), so a rebuild can change them: cache them briefly and then
+# revalidate, which is a cheap 304 from StaticFiles when they haven't changed.
+STATIC_CACHE_CONTROL = 'public, max-age=86400'
+VENDOR_CACHE_CONTROL = 'public, max-age=3600, must-revalidate'
+
+# Responses smaller than this (in bytes) are sent uncompressed
+GZIP_MINIMUM_SIZE = 512
+
 # SSE Configuration
 SSE_CONFIG = {
     'max_queue_size': 100,
     'history_size': 50,
     'default_timeout': 0.1
-}
\ No newline at end of file
+}
+
+# Client queues drop their oldest update when full; a connection that drops
+# this many updates without catching up in between is closed so the browser
+# reconnects fresh
+SSE_MAX_DROPPED_MESSAGES = 50
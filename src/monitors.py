@@ -0,0 +1,803 @@
+"""
+System metric collectors for the System Monitor Dashboard.
+
+Drop-in replacements for the cjm_fasthtml_sysmon collectors that are too
+expensive to run on every SSE tick. They return the same dictionaries, so the
+cjm_fasthtml_sysmon card renderers work with either.
+"""
+
+import atexit
+import functools
+import glob
+import heapq
+import os
+import platform
+import socket
+import sys
+import threading
+import time
+from collections import Counter
+from operator import itemgetter
+from datetime import datetime
+
+import psutil
+
+import config
+
+# Collectors read /proc directly on Linux and fall back to psutil elsewhere
+IS_LINUX = sys.platform.startswith('linux')
+
+# Per-policy current-frequency files (kHz); empty where cpufreq isn't exposed
+CPUFREQ_CURRENT_PATHS = sorted(glob.glob('/sys/devices/system/cpu/cpufreq/policy*/scaling_cur_freq'))
+
+
+@functools.lru_cache(maxsize=None)
+def get_cpu_freq_limits():
+    """Get the (min, max) CPU frequency in MHz; these are fixed hardware limits."""
+    cpu_freq = psutil.cpu_freq()
+    return (cpu_freq.min, cpu_freq.max) if cpu_freq else (0, 0)
+
+
+def read_cpu_freq_current():
+    """Read the current CPU frequency in MHz, averaged across cpufreq policies."""
+    if CPUFREQ_CURRENT_PATHS:
+        try:
+            total = 0
+            for path in CPUFREQ_CURRENT_PATHS:
+                with open(path, 'rb') as f:
+                    total += int(f.read())
+            return total / len(CPUFREQ_CURRENT_PATHS) / 1000
+        except (OSError, ValueError):
+            pass
+
+    # Without a frequency source (common in VMs and containers) psutil keeps
+    # returning None, so once it has there is no point probing again
+    if not config.CPU_FREQ_CACHE['supported']:
+        return 0
+    cpu_freq = psutil.cpu_freq()
+    if cpu_freq is None:
+        config.CPU_FREQ_CACHE['supported'] = False
+        return 0
+    return cpu_freq.current
+
+
+def get_static_system_info():
+    """Get system information that doesn't change during runtime."""
+    try:
+        hostname = socket.gethostname()
+    except OSError:
+        hostname = "Unknown"
+
+    freq_min, freq_max = get_cpu_freq_limits()
+    boot_timestamp = psutil.boot_time()
+
+    return {
+        'os': platform.system(),
+        'os_version': platform.version(),
+        'os_release': platform.release(),
+        'architecture': platform.machine(),
+        'processor': platform.processor() or "Unknown",
+        'hostname': hostname,
+        'python_version': sys.version.split()[0],
+        'cpu_count': psutil.cpu_count(logical=False),
+        'cpu_count_logical': psutil.cpu_count(logical=True),
+        'cpu_freq_min': freq_min,
+        'cpu_freq_max': freq_max,
+        'boot_time': datetime.fromtimestamp(boot_timestamp).strftime('%Y-%m-%d %H:%M:%S'),
+        'boot_timestamp': boot_timestamp
+    }
+
+
+def read_proc_stat_cpu_times():
+    """Read (busy, total) CPU ticks for all CPUs and then each core from one pass over /proc/stat."""
+    times = []
+    with open('/proc/stat', 'rb') as f:
+        for line in f:
+            if not line.startswith(b'cpu'):
+                break
+            fields = [int(field) for field in line.split()[1:]]
+            # Guest time is already counted in user and nice; idle excludes iowait
+            total = sum(fields) - sum(fields[8:10])
+            times.append((total - fields[3] - fields[4], total))
+    return times
+
+
+def calculate_cpu_percent(prev, current):
+    """Get the busy percentage between two (busy, total) tick samples, as psutil rounds it."""
+    total = current[1] - prev[1]
+    if total <= 0:
+        return 0.0
+    return round(min(100.0, max(0, current[0] - prev[0]) / total * 100), 1)
+
+
+def read_cpu_percents(update_baseline=True):
+    """Get the (overall, per-core) CPU percentages since the previous stored baseline.
+
+    With update_baseline=False the /proc/stat reading isn't stored, so a
+    one-off read (e.g. a page load) doesn't shorten the update loop's next
+    measurement window; psutil's fallback always moves its own baseline.
+    """
+    if IS_LINUX:
+        try:
+            times = read_proc_stat_cpu_times()
+        except (OSError, ValueError, IndexError):
+            pass
+        else:
+            cache = config.CPU_TIMES_CACHE
+            prev = cache['times'] if len(cache['times']) == len(times) else times
+            if update_baseline:
+                cache['times'] = times
+            percents = [calculate_cpu_percent(p, c) for p, c in zip(prev, times)]
+            return percents[0], percents[1:]
+
+    return psutil.cpu_percent(interval=None), psutil.cpu_percent(interval=None, percpu=True)
+
+
+def prime_cpu_percent():
+    """Seed the CPU time baselines for non-blocking CPU percentage reads."""
+    read_cpu_percents()
+
+
+def get_cpu_info(update_baseline=True):
+    """Get current CPU usage information without blocking.
+
+    Usage is measured since the previous call instead of over a sleep, so the
+    update loop's own cadence sets the measurement interval. On Linux the
+    overall and per-core figures come from a single read of /proc/stat.
+    """
+    cpu_percent, cpu_percent_per_core = read_cpu_percents(update_baseline)
+    freq_min, freq_max = get_cpu_freq_limits()
+
+    return {
+        'percent': cpu_percent,
+        'percent_per_core': cpu_percent_per_core,
+        'frequency_current': read_cpu_freq_current(),
+        'frequency_min': freq_min,
+        'frequency_max': freq_max,
+    }
+
+
+def read_proc_meminfo():
+    """Read /proc/meminfo into a dict of byte counts keyed by field name."""
+    meminfo = {}
+    with open('/proc/meminfo', 'rb') as f:
+        for line in f:
+            fields = line.split()
+            meminfo[fields[0]] = int(fields[1]) * 1024
+    return meminfo
+
+
+def get_memory_info():
+    """Get current memory and swap usage information.
+
+    On Linux both come from a single read of /proc/meminfo, computed as
+    psutil.virtual_memory() and psutil.swap_memory() do; the psutil calls
+    read it once each, and swap_memory() also reads /proc/vmstat.
+    """
+    if IS_LINUX:
+        try:
+            meminfo = read_proc_meminfo()
+            total = meminfo[b'MemTotal:']
+            available = meminfo[b'MemAvailable:']
+            swap_total = meminfo[b'SwapTotal:']
+            swap_used = swap_total - meminfo[b'SwapFree:']
+        except (OSError, ValueError, IndexError, KeyError):
+            pass
+        else:
+            # psutil estimates these edge cases itself, so leave them to it
+            if 0 < available <= total:
+                return {
+                    'total': total,
+                    'available': available,
+                    'used': total - available,
+                    'percent': round((total - available) / total * 100, 1),
+                    'swap_total': swap_total,
+                    'swap_used': swap_used,
+                    'swap_percent': round(swap_used / swap_total * 100, 1) if swap_total else 0.0
+                }
+
+    mem = psutil.virtual_memory()
+    swap = psutil.swap_memory()
+
+    return {
+        'total': mem.total,
+        'available': mem.available,
+        'used': mem.used,
+        'percent': mem.percent,
+        'swap_total': swap.total,
+        'swap_used': swap.used,
+        'swap_percent': swap.percent
+    }
+
+
+# Filesystems left out of the disk card; squashfs covers snap and AppImage
+# images, which would otherwise crowd out the real disks
+SKIPPED_FSTYPES = frozenset({'squashfs', 'tmpfs', 'overlay', 'proc', 'sysfs', 'fuse.snapfuse'})
+
+
+def get_disk_partitions(current_time):
+    """Get physical disk partitions, refreshed at most every DISK_PARTITIONS_TTL seconds."""
+    cache = config.DISK_PARTITIONS_CACHE
+    if current_time - cache['time'] > config.DISK_PARTITIONS_TTL:
+        cache['partitions'] = [
+            partition for partition in psutil.disk_partitions(all=False)
+            if partition.fstype and partition.fstype not in SKIPPED_FSTYPES
+        ]
+        cache['time'] = current_time
+    return cache['partitions']
+
+
+def read_disk_usage(mountpoint):
+    """Read (total, used, free, percent) for a mount point, computed as psutil.disk_usage() does."""
+    if not hasattr(os, 'statvfs'):
+        return tuple(psutil.disk_usage(mountpoint))
+
+    st = os.statvfs(mountpoint)
+    total = st.f_blocks * st.f_frsize
+    free = st.f_bavail * st.f_frsize
+    used = total - st.f_bfree * st.f_frsize
+    # Percent of the space available to unprivileged users, excluding root's reserve
+    user_total = used + free
+    percent = round(used / user_total * 100, 1) if user_total else 0.0
+    return total, used, free, percent
+
+
+def get_disk_info():
+    """Get disk usage information."""
+    disk_info = []
+
+    for partition in get_disk_partitions(time.monotonic()):
+        try:
+            total, used, free, percent = read_disk_usage(partition.mountpoint)
+        except OSError:
+            continue
+        disk_info.append({
+            'device': partition.device,
+            'mountpoint': partition.mountpoint,
+            'fstype': partition.fstype,
+            'total': total,
+            'used': used,
+            'free': free,
+            'percent': percent
+        })
+
+    return disk_info
+
+
+# Interfaces left out of the network card
+SKIPPED_INTERFACES = frozenset({'lo'})
+SKIPPED_INTERFACE_PREFIXES = ('veth',)
+
+
+def get_interface_addrs(current_time):
+    """Get (IPv4 addresses per interface, down interfaces), refreshed at most every NETWORK_ADDRS_TTL seconds."""
+    cache = config.NETWORK_ADDRS_CACHE
+    if current_time - cache['time'] > config.NETWORK_ADDRS_TTL:
+        af_inet = socket.AF_INET
+        cache['addrs'] = {
+            interface: [addr.address for addr in addrs if addr.family == af_inet]
+            for interface, addrs in psutil.net_if_addrs().items()
+        }
+        cache['down'] = frozenset(
+            interface for interface, stats in psutil.net_if_stats().items() if not stats.isup
+        )
+        cache['time'] = current_time
+    return cache['addrs'], cache['down']
+
+
+# Guards the network caches; the page handler and the update loop collect from
+# different threads
+NETWORK_CACHE_LOCK = threading.Lock()
+
+
+def get_network_info():
+    """Get network interface information and statistics."""
+    with NETWORK_CACHE_LOCK:
+        interfaces = collect_interface_stats()
+
+    return {
+        'interfaces': interfaces,
+        'connections': get_connection_stats()
+    }
+
+
+def collect_interface_stats():
+    """Get per-interface counters and bandwidth since the previous call."""
+    interfaces = []
+    stats = psutil.net_io_counters(pernic=True)
+
+    current_time = time.monotonic()
+    addrs, down = get_interface_addrs(current_time)
+    stats_cache = config.NETWORK_STATS_CACHE
+
+    for interface, io_stats in stats.items():
+        # Skip loopback, virtual ethernet and down interfaces
+        if (interface in SKIPPED_INTERFACES or interface in down
+                or interface.startswith(SKIPPED_INTERFACE_PREFIXES)):
+            continue
+
+        # Calculate bandwidth (bytes per second)
+        bytes_sent_per_sec = 0
+        bytes_recv_per_sec = 0
+
+        prev_stats = stats_cache.get(interface)
+        if prev_stats:
+            time_diff = current_time - prev_stats['time']
+
+            if time_diff > 0:
+                bytes_sent_per_sec = (io_stats.bytes_sent - prev_stats['bytes_sent']) / time_diff
+                bytes_recv_per_sec = (io_stats.bytes_recv - prev_stats['bytes_recv']) / time_diff
+
+        # Update cache
+        stats_cache[interface] = {
+            'bytes_sent': io_stats.bytes_sent,
+            'bytes_recv': io_stats.bytes_recv,
+            'time': current_time
+        }
+
+        interfaces.append({
+            'name': interface,
+            'ip_addresses': addrs.get(interface, []),
+            'bytes_sent': io_stats.bytes_sent,
+            'bytes_recv': io_stats.bytes_recv,
+            'packets_sent': io_stats.packets_sent,
+            'packets_recv': io_stats.packets_recv,
+            'bytes_sent_per_sec': max(0, bytes_sent_per_sec),  # Ensure non-negative
+            'bytes_recv_per_sec': max(0, bytes_recv_per_sec),
+            'errors_in': io_stats.errin,
+            'errors_out': io_stats.errout,
+            'drops_in': io_stats.dropin,
+            'drops_out': io_stats.dropout
+        })
+
+    return interfaces
+
+
+# Socket tables behind psutil's 'inet' connection kind on Linux
+PROC_NET_TCP_FILES = ('/proc/net/tcp', '/proc/net/tcp6')
+PROC_NET_UDP_FILES = ('/proc/net/udp', '/proc/net/udp6')
+
+# Hex TCP state codes from include/net/tcp_states.h
+TCP_STATE_CODES = {
+    'established': b'01',
+    'listen': b'0A',
+    'time_wait': b'06',
+    'close_wait': b'08',
+}
+
+
+def read_proc_net_rows(path):
+    """Read the socket rows of a /proc/net table; missing tables (e.g. no IPv6) are empty."""
+    try:
+        with open(path, 'rb') as f:
+            return f.readlines()[1:]
+    except FileNotFoundError:
+        return []
+
+
+def read_proc_net_connection_stats():
+    """Count inet sockets by state straight from the /proc/net tables.
+
+    psutil.net_connections() also maps every socket to its owning process by
+    walking /proc/<pid>/fd, which the dashboard doesn't need.
+    """
+    if not os.path.exists(PROC_NET_TCP_FILES[0]):
+        raise FileNotFoundError(PROC_NET_TCP_FILES[0])
+
+    # Column 3 is the socket state; UDP sockets have no TCP state, so they
+    # only count towards the total (psutil reports them as NONE)
+    tcp_states = Counter(
+        row.split(None, 4)[3]
+        for path in PROC_NET_TCP_FILES
+        for row in read_proc_net_rows(path)
+    )
+    udp_total = sum(len(read_proc_net_rows(path)) for path in PROC_NET_UDP_FILES)
+
+    stats = {'total': sum(tcp_states.values()) + udp_total}
+    for name, code in TCP_STATE_CODES.items():
+        stats[name] = tcp_states[code]
+    return stats
+
+
+def get_connection_stats():
+    """Get inet connection counts by state."""
+    if IS_LINUX:
+        try:
+            return read_proc_net_connection_stats()
+        except OSError:
+            pass
+
+    connections = psutil.net_connections(kind='inet')
+    statuses = Counter(conn.status for conn in connections)
+    return {
+        'total': len(connections),
+        'established': statuses['ESTABLISHED'],
+        'listen': statuses['LISTEN'],
+        'time_wait': statuses['TIME_WAIT'],
+        'close_wait': statuses['CLOSE_WAIT']
+    }
+
+
+PROCESS_ATTRS = ['pid', 'name', 'cpu_percent', 'memory_percent', 'memory_info', 'username', 'status']
+
+# Errors for processes that exit or can't be read mid-scan
+PROCESS_GONE_ERRORS = (psutil.NoSuchProcess, psutil.ZombieProcess)
+PROCESS_ERRORS = PROCESS_GONE_ERRORS + (psutil.AccessDenied,)
+
+
+def read_process_entry(pinfo):
+    """Build a process table entry from psutil info, or None for idle processes."""
+    cpu_percent = pinfo['cpu_percent']
+    memory_percent = pinfo['memory_percent'] or 0
+    # Skip kernel threads and processes with 0% CPU and memory
+    if cpu_percent is None or not (cpu_percent > 0 or memory_percent > 0):
+        return None
+
+    memory_info = pinfo['memory_info']
+    return {
+        'pid': pinfo['pid'],
+        'name': pinfo['name'],
+        'cpu_percent': cpu_percent,
+        'memory_percent': memory_percent,
+        'memory_mb': memory_info.rss / (1024 * 1024) if memory_info else 0,
+        'username': pinfo['username'] or 'N/A',
+        'status': pinfo['status'] or 'unknown'
+    }
+
+
+def scan_all_processes(cache):
+    """Re-read every process and reset the set of CPU-active PIDs."""
+    procs = {}
+    entries = {}
+    # Bound once; the loop body runs for every process on the host
+    read_entry = read_process_entry
+    errors = PROCESS_ERRORS
+    for proc in psutil.process_iter(PROCESS_ATTRS):
+        try:
+            entry = read_entry(proc.info)
+        except errors:
+            continue
+        procs[proc.pid] = proc
+        if entry:
+            entries[proc.pid] = entry
+
+    cache['procs'] = procs
+    cache['entries'] = entries
+    cache['active'] = {pid for pid, entry in entries.items() if entry['cpu_percent'] > 0}
+
+
+def sync_process_list(cache):
+    """Drop processes that have exited and start tracking new ones as active."""
+    procs = cache['procs']
+    entries = cache['entries']
+    active = cache['active']
+    pids = set(psutil.pids())
+    for pid in procs.keys() - pids:
+        del procs[pid]
+        entries.pop(pid, None)
+        active.discard(pid)
+    for pid in pids - procs.keys():
+        try:
+            procs[pid] = psutil.Process(pid)
+        except PROCESS_GONE_ERRORS:
+            continue
+        # Its first cpu_percent() has no baseline, so it is re-read on every
+        # update until the next full scan
+        active.add(pid)
+
+
+def scan_active_processes(cache):
+    """Re-read only the PIDs that were using CPU at the last full scan, or started since."""
+    procs = cache['procs']
+    entries = cache['entries']
+    for pid in list(cache['active']):
+        try:
+            # Reuse the Process object so cpu_percent() measures since its last call
+            entry = read_process_entry(procs[pid].as_dict(PROCESS_ATTRS))
+        except PROCESS_GONE_ERRORS:
+            cache['active'].discard(pid)
+            procs.pop(pid, None)
+            entries.pop(pid, None)
+            continue
+        except psutil.AccessDenied:
+            continue
+        if entry:
+            entries[pid] = entry
+        else:
+            entries.pop(pid, None)
+
+
+# Guards PROCESS_CACHE against concurrent page loads and update ticks
+PROCESS_CACHE_LOCK = threading.Lock()
+
+
+def get_process_info(top_n=5):
+    """Get top processes by CPU and memory usage.
+
+    A full process scan reads /proc/<pid>/stat for every process; between full
+    scans the PID list is still compared on every update, so exited processes
+    drop out and new ones are read, but of the rest only the processes that
+    were using CPU are refreshed.
+    """
+    cache = config.PROCESS_CACHE
+    with PROCESS_CACHE_LOCK:
+        current_time = time.monotonic()
+        if current_time - cache['time'] >= config.PROCESS_FULL_SCAN_INTERVAL:
+            scan_all_processes(cache)
+            cache['time'] = current_time
+        else:
+            sync_process_list(cache)
+            scan_active_processes(cache)
+        processes = list(cache['entries'].values())
+
+    status_counts = Counter(entry['status'] for entry in processes)
+
+    # Partial selection instead of sorting every process twice
+    return {
+        'top_cpu': heapq.nlargest(top_n, processes, key=itemgetter('cpu_percent')),
+        'top_memory': heapq.nlargest(top_n, processes, key=itemgetter('memory_percent')),
+        'total': len(processes),
+        'status_counts': dict(status_counts)
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def get_nvitop_devices():
+    """Discover NVIDIA devices through nvitop once; None if nvitop isn't installed.
+
+    GPUs don't come and go at runtime, and without a driver nvitop prints its
+    NVML error on every discovery, so this only runs once.
+    """
+    try:
+        from nvitop import Device
+    except ImportError:
+        return None
+    try:
+        return tuple(Device.all())
+    except Exception as e:
+        print(f"Error checking GPU: {e}")
+        return ()
+
+
+@functools.lru_cache(maxsize=None)
+def get_nvml_handles():
+    """Initialise NVML once and get a handle per GPU; empty without pynvml or a driver."""
+    try:
+        import pynvml
+        pynvml.nvmlInit()
+        return tuple(pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(pynvml.nvmlDeviceGetCount()))
+    except Exception:
+        return ()
+
+
+def get_nvitop_gpu_info(gpu_info, devices):
+    """Fill in device details and GPU processes from nvitop devices."""
+    from nvitop import GpuProcess, NA
+
+    for i, device in enumerate(devices):
+        name = device.name()
+
+        # Get memory in MB for consistency, with NA checks
+        mem_total = device.memory_total()
+        mem_used = device.memory_used()
+        mem_free = device.memory_free()
+
+        # Get power values and convert from milliwatts to watts
+        power_usage_mw = device.power_usage()
+        power_limit_mw = device.power_limit()
+
+        # Get other metrics with NA checks
+        gpu_util = device.gpu_utilization()
+        temp = device.temperature()
+        fan = device.fan_speed()
+        enc_util = device.encoder_utilization()
+        dec_util = device.decoder_utilization()
+        processes = device.processes()
+
+        gpu_info['details'][f'gpu_{i}'] = {
+            'name': name,
+            'memory_total': mem_total // (1024 * 1024) if mem_total and mem_total != NA else 0,
+            'memory_used': mem_used // (1024 * 1024) if mem_used and mem_used != NA else 0,
+            'memory_free': mem_free // (1024 * 1024) if mem_free and mem_free != NA else 0,
+            'utilization': gpu_util if gpu_util != NA else 0,
+            'temperature': temp if temp != NA else None,
+            'power_usage': power_usage_mw / 1000.0 if power_usage_mw and power_usage_mw != NA else None,
+            'power_limit': power_limit_mw / 1000.0 if power_limit_mw and power_limit_mw != NA else None,
+            'fan_speed': fan if fan != NA else None,
+            'compute_processes': len(processes),
+            'encoder_utilization': enc_util if enc_util != NA else 0,
+            'decoder_utilization': dec_util if dec_util != NA else 0,
+        }
+
+        if not processes:
+            continue
+
+        try:
+            for snapshot in GpuProcess.take_snapshots(processes.values(), failsafe=True):
+                gpu_mem = snapshot.gpu_memory
+                sm_util = getattr(snapshot, 'gpu_sm_utilization', 0)
+                gpu_info['processes'].append({
+                    'pid': snapshot.pid,
+                    'name': str(snapshot.command or f"PID {snapshot.pid}"),
+                    'gpu_memory_mb': gpu_mem // (1024 * 1024) if gpu_mem and gpu_mem != NA else 0,
+                    'gpu_utilization': sm_util if sm_util != NA else 0,
+                    'device_id': i,
+                    'device_name': name
+                })
+        except Exception as e:
+            print(f"Error processing GPU processes: {e}, type: {type(e).__name__}")
+
+
+def get_nvml_gpu_info(gpu_info, handles):
+    """Fill in device details straight from NVML for hosts without nvitop."""
+    import pynvml
+
+    def query(func, *args):
+        # Not every query is supported on every device
+        try:
+            return func(*args)
+        except pynvml.NVMLError:
+            return None
+
+    for i, handle in enumerate(handles):
+        name = query(pynvml.nvmlDeviceGetName, handle)
+        memory = query(pynvml.nvmlDeviceGetMemoryInfo, handle)
+        utilization = query(pynvml.nvmlDeviceGetUtilizationRates, handle)
+        power_usage_mw = query(pynvml.nvmlDeviceGetPowerUsage, handle)
+        power_limit_mw = query(pynvml.nvmlDeviceGetEnforcedPowerLimit, handle)
+        processes = query(pynvml.nvmlDeviceGetComputeRunningProcesses, handle)
+        encoder = query(pynvml.nvmlDeviceGetEncoderUtilization, handle)
+        decoder = query(pynvml.nvmlDeviceGetDecoderUtilization, handle)
+
+        gpu_info['details'][f'gpu_{i}'] = {
+            'name': name.decode() if isinstance(name, bytes) else name or 'Unknown',
+            'memory_total': memory.total // (1024 * 1024) if memory else 0,
+            'memory_used': memory.used // (1024 * 1024) if memory else 0,
+            'memory_free': memory.free // (1024 * 1024) if memory else 0,
+            'utilization': utilization.gpu if utilization else 0,
+            'temperature': query(pynvml.nvmlDeviceGetTemperature, handle, pynvml.NVML_TEMPERATURE_GPU),
+            'power_usage': power_usage_mw / 1000.0 if power_usage_mw else None,
+            'power_limit': power_limit_mw / 1000.0 if power_limit_mw else None,
+            'fan_speed': query(pynvml.nvmlDeviceGetFanSpeed, handle),
+            'compute_processes': len(processes) if processes is not None else None,
+            'encoder_utilization': encoder[0] if encoder else 0,
+            'decoder_utilization': decoder[0] if decoder else 0,
+        }
+
+
+def get_gpu_info():
+    """Get GPU availability, details and processes.
+
+    Device discovery happens once; each call only queries the known devices,
+    through nvitop when it is installed and NVML directly otherwise.
+    """
+    gpu_info = {'available': False, 'type': 'None', 'details': {}, 'processes': []}
+
+    devices = get_nvitop_devices()
+    handles = get_nvml_handles() if devices is None else ()
+    if not devices and not handles:
+        return gpu_info
+
+    gpu_info['available'] = True
+    gpu_info['type'] = 'NVIDIA'
+    try:
+        if devices:
+            get_nvitop_gpu_info(gpu_info, devices)
+        else:
+            get_nvml_gpu_info(gpu_info, handles)
+    except Exception as e:
+        print(f"Error checking GPU: {e}")
+
+    # Only the largest GPU memory users are displayed
+    gpu_info['processes'] = heapq.nlargest(
+        config.MAX_GPU_PROCESSES, gpu_info['processes'], key=itemgetter('gpu_memory_mb')
+    )
+
+    return gpu_info
+
+
+@functools.lru_cache(maxsize=None)
+def open_thermal_zones():
+    """Open each thermal zone's temp file once, as (fd, label) pairs.
+
+    The zone labels are fixed at boot and sysfs re-generates a file's value on
+    every read from offset 0, so each update is a single pread per zone.
+    """
+    zones = []
+    for i, temp_path in enumerate(glob.glob('/sys/class/thermal/thermal_zone*/temp')):
+        label = f"thermal_zone{i}"
+        try:
+            with open(os.path.join(os.path.dirname(temp_path), 'type')) as f:
+                label = f.read().strip()
+        except OSError:
+            pass
+        try:
+            zones.append((os.open(temp_path, os.O_RDONLY), label))
+        except OSError:
+            continue
+    return tuple(zones)
+
+
+@atexit.register
+def close_thermal_zones():
+    """Close the files opened by open_thermal_zones()."""
+    if open_thermal_zones.cache_info().currsize:
+        for fd, _ in open_thermal_zones():
+            os.close(fd)
+
+
+def read_thermal_zones():
+    """Read thermal zone temperatures (Linux) as sensor entries."""
+    temps = []
+    for fd, label in open_thermal_zones():
+        try:
+            temp_celsius = int(os.pread(fd, 16, 0)) / 1000.0
+        except (OSError, ValueError):
+            continue
+        temps.append({
+            'type': 'thermal',
+            'label': label,
+            'current': temp_celsius,
+            'high': 85.0,  # Default high threshold
+            'critical': 95.0  # Default critical threshold
+        })
+    return temps
+
+
+def read_nvml_temperatures():
+    """Read NVIDIA GPU temperatures through NVML as sensor entries."""
+    handles = get_nvml_handles()
+    if not handles:
+        return []
+
+    import pynvml
+    temps = []
+    for i, handle in enumerate(handles):
+        try:
+            temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+        except pynvml.NVMLError:
+            continue
+        temps.append({
+            'type': 'gpu',
+            'label': f'NVIDIA GPU {i}',
+            'current': float(temp),
+            'high': 80.0,
+            'critical': 90.0
+        })
+    return temps
+
+
+def get_temperature_info():
+    """Get temperature sensor information."""
+    temps = []
+
+    try:
+        if hasattr(psutil, 'sensors_temperatures'):
+            for sensor_type, sensors in psutil.sensors_temperatures().items():
+                for sensor in sensors:
+                    # Filter out sensors with invalid readings
+                    if sensor.current is not None and sensor.current > 0:
+                        temps.append({
+                            'type': sensor_type,
+                            'label': sensor.label or sensor_type,
+                            'current': sensor.current,
+                            'high': sensor.high,
+                            'critical': sensor.critical
+                        })
+    except Exception as e:
+        print(f"Error getting temperature sensors: {e}")
+
+    # If psutil doesn't provide temps, fall back to the thermal zones
+    if not temps:
+        temps = read_thermal_zones()
+
+    # With nvitop, GPU temperatures are shown on the GPU card instead
+    if get_nvitop_devices() is None:
+        temps.extend(read_nvml_temperatures())
+
+    return temps
+
+
+# The first non-blocking readings are measured from here
+prime_cpu_percent()
+scan_all_processes(config.PROCESS_CACHE)
@@ -2,12 +2,13 @@
 Utility functions for the System Monitor Dashboard.
 """
 
+import bisect
+import functools
+import shutil
 import socket
-import webbrowser
-import subprocess
 import sys
+import time
 from contextlib import closing
-from datetime import datetime
 
 # DaisyUI imports
 from cjm_fasthtml_daisyui.components.data_display.badge import badge_colors
@@ -23,34 +24,36 @@ def find_free_port():
         return s.getsockname()[1]
 
 
+# Unit suffixes indexed by power of 1024
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+BANDWIDTH_UNITS = ('B/s', 'KB/s', 'MB/s', 'GB/s')
+
+
+# Totals repeat on every render (disk and memory sizes), so most calls are hits
+@functools.lru_cache(maxsize=1024)
 def format_bytes(bytes_value):
     """Format bytes to human readable string."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.1f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.1f} PB"
+    if bytes_value < 1024:
+        return f"{bytes_value:.1f} B"
+    # Each unit is 10 more bits, so the bit length picks it without a loop
+    idx = min((int(bytes_value).bit_length() - 1) // 10, len(BYTE_UNITS) - 1)
+    return f"{bytes_value / (1 << (idx * 10)):.1f} {BYTE_UNITS[idx]}"
 
 
 def format_bandwidth(bytes_per_sec):
     """Format bandwidth to human readable string."""
     if bytes_per_sec < 1024:
         return f"{bytes_per_sec:.0f} B/s"
-    elif bytes_per_sec < 1024 * 1024:
-        return f"{bytes_per_sec / 1024:.1f} KB/s"
-    elif bytes_per_sec < 1024 * 1024 * 1024:
-        return f"{bytes_per_sec / (1024 * 1024):.1f} MB/s"
-    else:
-        return f"{bytes_per_sec / (1024 * 1024 * 1024):.1f} GB/s"
+    idx = min((int(bytes_per_sec).bit_length() - 1) // 10, len(BANDWIDTH_UNITS) - 1)
+    return f"{bytes_per_sec / (1 << (idx * 10)):.1f} {BANDWIDTH_UNITS[idx]}"
 
 
-def format_uptime(boot_time_str):
-    """Format uptime from boot time string."""
-    boot_time = datetime.strptime(boot_time_str, '%Y-%m-%d %H:%M:%S')
-    uptime = datetime.now() - boot_time
-    days = uptime.days
-    hours = uptime.seconds // 3600
-    minutes = (uptime.seconds % 3600) // 60
+def format_uptime(boot_timestamp):
+    """Format uptime from the boot time as a Unix timestamp."""
+    uptime = int(time.time() - boot_timestamp)
+    days, remainder = divmod(uptime, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes = remainder // 60
 
     if days > 0:
         return f"{days}d {hours}h {minutes}m"
@@ -60,43 +63,70 @@ def format_uptime(boot_time_str):
         return f"{minutes}m"
 
 
+# Progress bar colors below 50%, below 80% and from 80% up
+PROGRESS_THRESHOLDS = (50, 80)
+PROGRESS_COLORS = (progress_colors.success, progress_colors.warning, progress_colors.error)
+
+
 def get_progress_color(percent):
     """Get progress bar color based on percentage."""
-    if percent < 50:
-        return progress_colors.success
-    elif percent < 80:
-        return progress_colors.warning
-    else:
-        return progress_colors.error
+    return PROGRESS_COLORS[bisect.bisect_right(PROGRESS_THRESHOLDS, percent)]
 
 
-def get_temperature_color(temp_celsius, high=85, critical=95):
-    """Get color for temperature display."""
+# Colors for each temperature level returned by get_temperature_level()
+TEMPERATURE_COLORS = (text_dui.success, text_dui.primary, text_dui.warning, text_dui.error)
+TEMPERATURE_BADGE_COLORS = (badge_colors.success, badge_colors.primary, badge_colors.warning, badge_colors.error)
+
+
+def get_temperature_level(temp_celsius, high=85):
+    """Get the temperature level: 0 cool, 1 normal, 2 warm, 3 at or above the high limit."""
     if temp_celsius < 50:
-        return text_dui.success
+        return 0
     elif temp_celsius < 70:
-        return text_dui.primary
+        return 1
     elif temp_celsius < high:
-        return text_dui.warning
+        return 2
     else:
-        return text_dui.error
+        return 3
+
+
+def get_temperature_color(temp_celsius, high=85, critical=95):
+    """Get color for temperature display."""
+    return TEMPERATURE_COLORS[get_temperature_level(temp_celsius, high)]
 
 
 def get_temperature_badge_color(temp_celsius, high=85, critical=95):
     """Get badge color for temperature."""
-    if temp_celsius < 50:
-        return badge_colors.success
-    elif temp_celsius < 70:
-        return badge_colors.primary
-    elif temp_celsius < high:
-        return badge_colors.warning
-    else:
-        return badge_colors.error
+    return TEMPERATURE_BADGE_COLORS[get_temperature_level(temp_celsius, high)]
+
+
+# Browsers that can open a standalone app window, in order of preference
+APP_BROWSERS = (
+    ('google-chrome', ('--app={url}',)),
+    ('chromium', ('--app={url}',)),
+    ('firefox', ('--new-window', '{url}')),
+)
+
+
+def find_app_browser():
+    """Find the first installed app-mode browser as (path, arg templates)."""
+    for cmd, args in APP_BROWSERS:
+        path = shutil.which(cmd)
+        if path:
+            return path, args
+    return None
+
+
+# Resolved once at import so launching does not probe missing executables
+APP_BROWSER = find_app_browser() if sys.platform == 'linux' else None
 
 
 def open_browser(url):
     """Open browser based on environment settings."""
+    # Only needed once at launch, so keep them off the import path
     import os
+    import subprocess
+    import webbrowser
 
     browser_mode = os.environ.get('FASTHTML_BROWSER', 'default').lower()
 
@@ -108,21 +138,15 @@ def open_browser(url):
     if browser_mode == 'app':
         print(f"Opening in app mode at {url}")
 
-        if sys.platform == 'linux':
-            browsers = [
-                ['google-chrome', '--app=' + url],
-                ['chromium', '--app=' + url],
-                ['firefox', '--new-window', url],
-            ]
-
-            for browser_cmd in browsers:
-                try:
-                    subprocess.Popen(browser_cmd,
-                                   stdout=subprocess.DEVNULL,
-                                   stderr=subprocess.DEVNULL)
-                    return
-                except FileNotFoundError:
-                    continue
+        if APP_BROWSER:
+            path, args = APP_BROWSER
+            try:
+                subprocess.Popen([path, *(arg.format(url=url) for arg in args)],
+                               stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL)
+                return
+            except OSError:
+                pass
 
     print(f"Opening in browser at {url}")
     webbrowser.open(url)
\ No newline at end of file